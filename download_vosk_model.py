@@ -1,11 +1,90 @@
 import os
-import urllib.request
+import tempfile
+import threading
 import zipfile
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import requests
+
+CHUNK_SIZE = 1 << 20
+DOWNLOAD_CONNECTIONS = 8
+
+class RangeNotSupportedError(IOError):
+    """The server answered a byte range request with something other than that range"""
+
+def report_progress(label, done, total):
+    percent = int(done * 100 / total) if total else 0
+    sys.stdout.write(f"\r{label}: {percent}%")
+    sys.stdout.flush()
+
+def create_session():
+    """Create a session whose connection pool can serve every download connection"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=DOWNLOAD_CONNECTIONS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def probe_download(session, url):
+    """Return the size of the resource and whether the server accepts byte ranges"""
+    response = session.head(url, allow_redirects=True)
+    response.raise_for_status()
+    total_size = int(response.headers.get('Content-Length', 0))
+    accepts_ranges = response.headers.get('Accept-Ranges', '').lower() == 'bytes'
+    return total_size, accepts_ranges
+
+def download_serial(session, url, out_file):
+    with session.get(url, stream=True) as response:
+        response.raise_for_status()
+        total_size = int(response.headers.get('Content-Length', 0))
+        downloaded = 0
+        for chunk in response.iter_content(CHUNK_SIZE):
+            out_file.write(chunk)
+            downloaded += len(chunk)
+            report_progress("Downloading", downloaded, total_size)
+
+def download_ranges(session, url, out_file, total_size):
+    """Download the resource over several connections, one byte range each"""
+    lock = threading.Lock()
+    cancelled = threading.Event()
+    downloaded = 0
+
+    def fetch_range(start, end):
+        nonlocal downloaded
+        headers = {'Range': f"bytes={start}-{end}"}
+        with session.get(url, headers=headers, stream=True) as response:
+            if response.status_code != 206:
+                raise RangeNotSupportedError(f"Server ignored range request for bytes {start}-{end}")
+            offset = start
+            for chunk in response.iter_content(CHUNK_SIZE):
+                if cancelled.is_set():
+                    return
+                with lock:
+                    out_file.seek(offset)
+                    out_file.write(chunk)
+                    downloaded += len(chunk)
+                    report_progress("Downloading", downloaded, total_size)
+                offset += len(chunk)
+
+    out_file.truncate(total_size)
+    range_size = -(-total_size // DOWNLOAD_CONNECTIONS)
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_CONNECTIONS) as executor:
+        futures = [
+            executor.submit(fetch_range, start, min(start + range_size, total_size) - 1)
+            for start in range(0, total_size, range_size)
+        ]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except Exception:
+            # Stop the other ranges before the caller reuses the file
+            cancelled.set()
+            for future in futures:
+                future.cancel()
+            raise
 
 def download_and_extract_model():
     model_url = "https://alphacephei.com/vosk/models/vosk-model-en-us-0.22.zip"
-    model_zip = "models/vosk-model-en-us-0.22.zip"
     model_dir = "models/vosk-model-en-us-0.22"
 
     if not os.path.exists(model_dir):
@@ -14,26 +93,52 @@ def download_and_extract_model():
 
         print("Downloading Vosk model...")
 
-        def reporthook(block_num, block_size, total_size):
-            downloaded = block_num * block_size
-            percent = int(downloaded * 100 / total_size)
-            sys.stdout.write(f"\rDownloading: {percent}%")
-            sys.stdout.flush()
-        urllib.request.urlretrieve(model_url, model_zip, reporthook)
-        print("\nDownload completed.")
-
-        print("Extracting the model...")
-
-        with zipfile.ZipFile(model_zip, 'r') as zip_ref:
-            total_files = len(zip_ref.infolist())
-            for i, file in enumerate(zip_ref.infolist()):
-                zip_ref.extract(file, "models")
-                percent = int((i + 1) * 100 / total_files)
-                sys.stdout.write(f"\rExtracting: {percent}%")
-                sys.stdout.flush()
-        print("\nExtraction completed.")
-
-        os.remove(model_zip)
+        # Download into a temporary file and extract from there, instead of
+        # writing the zip into models/ and deleting it afterwards.
+        with tempfile.TemporaryFile() as model_zip, create_session() as session:
+            total_size, accepts_ranges = probe_download(session, model_url)
+            if accepts_ranges and total_size:
+                try:
+                    download_ranges(session, model_url, model_zip, total_size)
+                except RangeNotSupportedError:
+                    print("\nServer ignored byte ranges, downloading over one connection...")
+                    model_zip.seek(0)
+                    model_zip.truncate()
+                    download_serial(session, model_url, model_zip)
+            else:
+                download_serial(session, model_url, model_zip)
+            print("\nDownload completed.")
+
+            print("Extracting the model...")
+
+            model_zip.seek(0)
+            with zipfile.ZipFile(model_zip, 'r') as zip_ref:
+                members = zip_ref.infolist()
+                total_files = len(members)
+
+                # Create the directory tree up front so the workers below
+                # never race each other creating the same parent directory.
+                for member in members:
+                    if member.is_dir():
+                        zip_ref.extract(member, "models")
+                    else:
+                        parent = os.path.dirname(member.filename)
+                        os.makedirs(os.path.join("models", parent), exist_ok=True)
+
+                # zlib releases the GIL while inflating, so threads spread
+                # the decompression of the many small model files over cores.
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    futures = [
+                        executor.submit(zip_ref.extract, member, "models")
+                        for member in members if not member.is_dir()
+                    ]
+                    extracted = total_files - len(futures)
+                    for future in as_completed(futures):
+                        future.result()
+                        extracted += 1
+                        report_progress("Extracting", extracted, total_files)
+            print("\nExtraction completed.")
+
         print("Cleanup completed.")
     else:
         print("Model already exists. Skipping download.")
@@ -1,16 +1,43 @@
 import threading
 import logging
-import time
+from types import MappingProxyType
+from functools import lru_cache
 from uuid import UUID
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, FrozenSet, List, Any, Mapping, Optional, Tuple
 from seamlessconv.event.eventbus import EventBus, Event
 from seamlessconv.event.event_types import EventType
 from seamlessconv.llm.llm_utils import load_prompt
 from seamlessconv.agents.speaker_types import SpeakerState
+from seamlessconv.agents.decision_cache import DecisionCache
 from seamlessconv.database.session_manager import SessionManager
 
 logger = logging.getLogger(__name__)
 
+# Shared by all agents, entries are keyed by the agent they were made for
+_decision_cache = DecisionCache()
+
+@lru_cache(maxsize=None)
+def _build_system_prompts(
+    personality_file_path: str
+) -> Tuple[Tuple[Mapping[str, str], ...], Tuple[Mapping[str, str], ...]]:
+    """
+    Build the decision and response system prompts, shared between agents.
+    They are read-only so every agent can hand out the same objects.
+    """
+    personality = "\n[PERSONALITY]\n" + load_prompt(personality_file_path)
+
+    decision_prompt = (MappingProxyType({
+        "role": "system",
+        "content": load_prompt('ai_prompts/system/decision_prompt.txt') + personality
+    }),)
+
+    response_prompt = (MappingProxyType({
+        "role": "system",
+        "content": load_prompt('ai_prompts/system/response_prompt.txt') + personality
+    }),)
+
+    return decision_prompt, response_prompt
+
 class Agent:
     def __init__(self, agent_id: UUID, event_bus: EventBus, store: SessionManager, is_user: bool = False):
         self.agent_id: UUID = agent_id
@@ -21,141 +48,260 @@ class Agent:
         self._lock: threading.Lock = threading.Lock()
         self.state: SpeakerState = SpeakerState.WAITING
         self.store: SessionManager = store
+        self._on_state_change: Optional[Callable[[UUID, SpeakerState], None]] = None
 
-        self._personality: Optional[str] = None
-        self._decision_prompt: List[Dict[str, str]] = []
-        self._response_prompt: List[Dict[str, str]] = []
+        self._decision_prompt: Tuple[Mapping[str, str], ...] = ()
+        self._response_prompt: Tuple[Mapping[str, str], ...] = ()
+
+        # Messages this agent has witnessed in its group, in the order they were
+        # stored. Loaded when joining a group, None while not in one.
+        self._history_cache: Optional[List[Dict[str, Any]]] = None
+        # Chat formatted views of the cache, keyed by the message types they include
+        self._formatted_history: Dict[FrozenSet[str], List[Dict[str, str]]] = {}
 
     def set_system_prompts(self, personality_file_path: str) -> None:
         """Load and set system prompts for the agent"""
-        self._personality = "\n[PERSONALITY]\n" + load_prompt(personality_file_path)
+        self._decision_prompt, self._response_prompt = _build_system_prompts(personality_file_path)
+
+    def load_history(self, group_id: UUID) -> Optional[List[Dict[str, Any]]]:
+        """
+        Load the messages this agent witnessed in a group, for set_group.
+        Waits for queued messages to be stored, so call it without holding
+        the group or dialogue locks.
+        """
+        if self.is_user:
+            return None
+        return self.store.get_agent_messages(self.agent_id, group_id)
+
+    def set_group(
+        self,
+        group_id: str,
+        on_state_change: Optional[Callable[[UUID, SpeakerState], None]] = None,
+        history: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """Assign agent to a conversation group with its history there from load_history"""
+        with self._lock:
+            self.group_id = group_id
+            self._on_state_change = on_state_change
+            self._history_cache = history
+            self._formatted_history.clear()
 
-        self._decision_prompt = [{
-            "role": "system",
-            "content": load_prompt('ai_prompts/system/decision_prompt.txt') + self._personality
-        }]
+    def append_history(self, event: Event) -> None:
+        """Append a stored message witnessed by this agent to its history cache"""
+        with self._lock:
+            if self._history_cache is None:
+                # Not in a group, the history is loaded when joining one
+                return
 
-        self._response_prompt = [{
-            "role": "system",
-            "content": load_prompt('ai_prompts/system/response_prompt.txt') + self._personality
-        }]
+            msg = {
+                'content': event.data['text'],
+                'type': event.data['context']['type'],
+                'source_agent_id': event.agent_id
+            }
+            self._history_cache.append(msg)
+
+            # Only the new message needs formatting, earlier ones never change role
+            formatted = {
+                "role": "assistant" if event.agent_id == self.agent_id else "user",
+                "content": msg['content']
+            }
+            for message_types, view in self._formatted_history.items():
+                if msg['type'] in message_types:
+                    view.append(formatted)
 
-    def set_group(self, group_id: str) -> None:
-        """Assign agent to a conversation group"""
-        self.group_id = group_id
+    def _get_history(self, message_types: List[str]) -> List[Dict[str, str]]:
+        """Get cached messages of the given types in chat format"""
+        if self._history_cache is None:
+            return []
+
+        key = frozenset(message_types)
+        view = self._formatted_history.get(key)
+        if view is None:
+            view = self._format_messages(
+                [msg for msg in self._history_cache if msg['type'] in key],
+                self.agent_id
+            )
+            self._formatted_history[key] = view
+
+        # Copy, the view keeps growing after the request has been published
+        return list(view)
 
     def update_conversation(self, event: Event) -> None:
         """Handle incoming transcription events"""
+        # Only the state transition is guarded, publishing happens after release
         with self._lock:
-            interruption = event.data.get('context', {}).get('interruption', {})
-            is_interrupted = bool(interruption.get('interrupted'))
-            logger.debug("Agent %s interrupted status: %s", self.agent_id, is_interrupted)
+            request = self._handle_transcription(event)
+        if request:
+            self._event_bus.publish(request)
 
-            if is_interrupted and self.state == SpeakerState.SPEAKING:
-                self._handle_interruption(event)
-                return
+    def _handle_transcription(self, event: Event) -> Optional[Event]:
+        """Update state for a transcription event, returning any LLM request to publish"""
+        interruption = event.data.get('context', {}).get('interruption', {})
+        is_interrupted = bool(interruption.get('interrupted'))
+        logger.debug("Agent %s interrupted status: %s", self.agent_id, is_interrupted)
+
+        if is_interrupted and self.state is SpeakerState.SPEAKING:
+            return self._handle_interruption(event)
 
-            if self.state == SpeakerState.WAITING:
-                self.state = SpeakerState.PENDING_DECISION
-                self._request_decision(event)
+        if self.state is SpeakerState.WAITING:
+            self.state = SpeakerState.PENDING_DECISION
+            return self._request_decision(event)
 
-    def _handle_interruption(self, event: Event) -> None:
+        return None
+
+    def _handle_interruption(self, event: Event) -> Event:
         """Handle interruption events"""
         logger.debug("Handling interruption for agent: %s", self.agent_id)
-        self._request_llm_decision(event, include_interruption=True)
+        return self._request_llm_decision(event, include_interruption=True)
 
-    def _request_decision(self, event: Event) -> None:
+    def _request_decision(self, event: Event) -> Event:
         """Request decision about whether to speak"""
         logger.debug("Requesting speaking decision for agent %s", self.agent_id)
-        self._request_llm_decision(event)
+        return self._request_llm_decision(event)
 
-    def _request_llm_decision(self, event: Event, include_interruption: bool = False) -> None:
-        """Make LLM request for decision making"""
-        history = self.store.get_messages(event, ["decision", "response"])
+    def _request_llm_decision(self, event: Event, include_interruption: bool = False) -> Event:
+        """Create LLM request for decision making"""
+        history = self._get_history(["decision", "response"])
 
         context_data = {'type': 'decision'}
         if include_interruption:
             context_data['interruption'] = event.data['context']['interruption']
 
-        self._event_bus.publish(Event(
+        key = _decision_cache.make_key(
+            self.agent_id,
+            self._decision_prompt[0]['content'] if self._decision_prompt else "",
+            history,
+            include_interruption
+        )
+        decision = _decision_cache.get(key)
+        if decision is not None:
+            logger.debug("Agent %s reusing cached decision %s", self.agent_id, decision)
+            return Event(
+                type=EventType.LLM_RESPONSE_READY,
+                agent_id=self.agent_id,
+                group_id=event.group_id,
+                timestamp=event.timestamp,
+                data={'text': decision, 'context': context_data}
+            )
+        context_data['decision_key'] = key
+
+        return Event(
             type=EventType.LLM_INPUT_RECEIVED,
             agent_id=self.agent_id,
             group_id=event.group_id,
             timestamp=event.timestamp,
             data={
-                'text': self._decision_prompt + self._format_messages(history, self.agent_id),
+                'system': self._decision_prompt,
+                'messages': history,
                 'context': context_data
             }
-        ))
+        )
 
     def handle_llm(self, event: Event) -> None:
         """Handle LLM response events"""
+        # Only the state transition is guarded, the group is notified and
+        # requests are published after release
         with self._lock:
-            if self.state == SpeakerState.PENDING_RESPONSE:
-                logger.error("Agent %s already pending response", self.agent_id)
+            previous = self.state
+            request = self._handle_decision(event)
+            state = self.state
+        if state is not previous:
+            self._notify_state_change(state)
+        if request:
+            self._event_bus.publish(request)
+
+    def handle_llm_error(self) -> None:
+        """Give up on a failed LLM request, an agent still speaking keeps speaking"""
+        with self._lock:
+            if self.state is SpeakerState.SPEAKING:
                 return
+            self.state = SpeakerState.WAITING
+        self._notify_state_change(SpeakerState.WAITING)
 
-            if self.state != SpeakerState.SPEAKING:
-                self.state = SpeakerState.PENDING_RESPONSE
+    def _handle_decision(self, event: Event) -> Optional[Event]:
+        """Update state for an LLM decision, returning any event to publish"""
+        key = event.data['context'].pop('decision_key', None)
+        if key is not None:
+            _decision_cache.put(key, event.data['text'])
 
-            decision = event.data['text']
+        if self.state is SpeakerState.PENDING_RESPONSE:
+            logger.error("Agent %s already pending response", self.agent_id)
+            return None
 
-            if decision == "[SKIP]":
-                self.reset_pending()
-                return
+        if self.state is not SpeakerState.SPEAKING:
+            self.state = SpeakerState.PENDING_RESPONSE
 
-            if decision == "[GETINTERRUPTED]":
-                self._handle_get_interrupted(event)
-                return
+        decision = event.data['text']
 
-            if decision == "[CONTINUE]":
-                return
+        if decision == "[SKIP]":
+            self.state = SpeakerState.WAITING
+            return None
 
-            if decision != "[RESPONSE]" and self.state == SpeakerState.SPEAKING:
-                return
+        if decision == "[GETINTERRUPTED]":
+            return self._handle_get_interrupted(event)
 
-            if self.state == SpeakerState.SPEAKING:
-                logger.error("Agent %s requested response while speaking", self.agent_id)
-                return
+        if decision == "[CONTINUE]":
+            return None
 
-            self._request_response_generation(event)
+        if decision != "[RESPONSE]" and self.state is SpeakerState.SPEAKING:
+            return None
 
-    def _handle_get_interrupted(self, event: Event) -> None:
+        if self.state is SpeakerState.SPEAKING:
+            logger.error("Agent %s requested response while speaking", self.agent_id)
+            return None
+
+        return self._request_response_generation(event)
+
+    def _handle_get_interrupted(self, event: Event) -> Event:
         """Handle getting interrupted"""
-        self._event_bus.publish(Event(
+        self.state = SpeakerState.WAITING
+        return Event(
             type=EventType.TTS_STOP_SPEAKING,
             agent_id=self.agent_id,
             group_id=event.group_id,
-            timestamp=time.time(),
+            timestamp=event.timestamp,
             data={}
-        ))
-        self.reset_pending()
+        )
 
-    def _request_response_generation(self, event: Event) -> None:
-        """Request response generation from LLM"""
-        history = self.store.get_messages(event, ["response"])
+    def _request_response_generation(self, event: Event) -> Event:
+        """Create request for response generation from LLM"""
+        history = self._get_history(["response"])
 
         logger.debug("Agent %s requesting response generation. State: %s", self.agent_id, self.state)
-        self._event_bus.publish(Event(
+        return Event(
             type=EventType.LLM_INPUT_RECEIVED,
             agent_id=self.agent_id,
             group_id=event.group_id,
             timestamp=event.timestamp,
             data={
-                'text': self._response_prompt + self._format_messages(history, self.agent_id),
+                'system': self._response_prompt,
+                'messages': history,
                 'context': {
                     'type': 'response'
                 }
             }
-        ))
+        )
 
     def reset_pending(self) -> None:
         """Reset agent state to waiting"""
-        self.state = SpeakerState.WAITING
+        with self._lock:
+            self.state = SpeakerState.WAITING
+        self._notify_state_change(SpeakerState.WAITING)
 
     def set_speaking(self) -> None:
         """Set agent state to speaking"""
-        self.state = SpeakerState.SPEAKING
+        with self._lock:
+            self.state = SpeakerState.SPEAKING
+        self._notify_state_change(SpeakerState.SPEAKING)
+
+    def _notify_state_change(self, state: SpeakerState) -> None:
+        """
+        Tell the group about a state change. Called without holding the agent
+        lock, since the group takes its own lock and calls back into the agent.
+        """
+        on_state_change = self._on_state_change
+        if on_state_change:
+            on_state_change(self.agent_id, state)
 
     @staticmethod
     def _format_messages(history: List[Dict[str, Any]], agent_id: str) -> List[Dict[str, str]]:
@@ -1,6 +1,6 @@
 import threading
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from uuid import UUID
 from seamlessconv.agents.agent import Agent
 from seamlessconv.agents.speaker_types import SpeakerState
@@ -8,22 +8,55 @@ from seamlessconv.agents.speaker_types import SpeakerState
 logger = logging.getLogger(__name__)
 
 class ConversationGroup:
+    """
+    Members and speaking ids are replaced on every change instead of being
+    modified in place, so readers use the current snapshot without locking.
+    The lock only serializes writers.
+    """
     def __init__(self, group_id: UUID):
         self.group_id: UUID = group_id
         self._members: Dict[UUID, Agent] = {}
+        self._speaking_ids: FrozenSet[UUID] = frozenset()
+        self._llm_members: Tuple[Agent, ...] = ()
         self._lock: threading.Lock = threading.Lock()
 
     def add_member(self, agent: Agent) -> None:
         """Add an agent to the conversation group"""
+        # Loading the history waits on the database and the agent takes its own
+        # lock, so the agent is set up before taking the group's
+        history = agent.load_history(self.group_id)
+        agent.set_group(self.group_id, self.on_state_change, history)
         with self._lock:
-            self._members[agent.agent_id] = agent
-            agent.set_group(self.group_id)
+            if agent.state is SpeakerState.SPEAKING:
+                self._speaking_ids = self._speaking_ids | {agent.agent_id}
+            self._members = {**self._members, agent.agent_id: agent}
+            self._update_llm_members()
 
     def remove_member(self, agent: Agent) -> None:
         """Remove an agent from the conversation group"""
         with self._lock:
-            agent.set_group(None)
-            self._members.pop(agent.agent_id, None)
+            members = dict(self._members)
+            members.pop(agent.agent_id, None)
+            self._members = members
+            self._speaking_ids = self._speaking_ids - {agent.agent_id}
+            self._update_llm_members()
+        agent.set_group(None)
+
+    def _update_llm_members(self) -> None:
+        """Rebuild the snapshot of non-user members, called with the lock held"""
+        self._llm_members = tuple(agent for agent in self._members.values() if not agent.is_user)
+
+    def on_state_change(self, agent_id: UUID, state: SpeakerState) -> None:
+        """Keep track of speaking members as their state changes"""
+        with self._lock:
+            if agent_id not in self._members:
+                return
+            speaking = state is SpeakerState.SPEAKING
+            if speaking != (agent_id in self._speaking_ids):
+                if speaking:
+                    self._speaking_ids = self._speaking_ids | {agent_id}
+                else:
+                    self._speaking_ids = self._speaking_ids - {agent_id}
 
     def is_member(self, agent_id: UUID) -> bool:
         """Check if an agent is a member of this group"""
@@ -31,13 +64,17 @@ class ConversationGroup:
 
     def get_speaking_members(self) -> List[Agent]:
         """Get all currently speaking members"""
-        return [agent for agent in self._members.values()
-                if agent.state == SpeakerState.SPEAKING]
+        members = self._members
+        return [members[agent_id] for agent_id in self._speaking_ids if agent_id in members]
 
     def get_members(self) -> List[Agent]:
         """Get all members of the group"""
         return list(self._members.values())
 
+    def get_llm_members(self) -> Tuple[Agent, ...]:
+        """Get all members driven by an LLM, i.e. everyone except the user"""
+        return self._llm_members
+
     def get_member(self, agent_id: UUID) -> Optional[Agent]:
         """Get a specific member by ID"""
         return self._members.get(agent_id)
@@ -0,0 +1,45 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+class DecisionCache:
+    """
+    Caches decision tokens returned by the LLM, keyed by the agent, its decision
+    prompt and the most recent messages. Decisions only depend on local context,
+    so an agent seeing the same recent conversation again can reuse its earlier
+    decision instead of making another LLM request.
+    """
+    def __init__(self, window: int = 8, max_entries: int = 1024):
+        self.window = window
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def make_key(
+        self,
+        agent_id: Hashable,
+        prompt: str,
+        messages: List[Dict[str, str]],
+        include_interruption: bool
+    ) -> Tuple:
+        """Build the cache key for a decision request"""
+        recent = tuple((msg['role'], msg['content']) for msg in messages[-self.window:])
+        return (agent_id, prompt, include_interruption, recent)
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Get the cached decision for a key, if any"""
+        with self._lock:
+            decision = self._entries.get(key)
+            if decision is not None:
+                self._entries.move_to_end(key)
+            return decision
+
+    def put(self, key: Hashable, decision: str) -> None:
+        """Cache a decision, only control tokens such as [SKIP] are kept"""
+        if not (decision.startswith('[') and decision.endswith(']')):
+            return
+        with self._lock:
+            self._entries[key] = decision
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
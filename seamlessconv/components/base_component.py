@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections import deque
+from typing import Any, Iterator, Optional
 import threading
-import queue
 import logging
 from seamlessconv.event.eventbus import EventBus
 
@@ -13,7 +13,9 @@ class BaseComponent(ABC):
         self.event_bus = event_bus
         self.running = False
         self._thread: Optional[threading.Thread] = None
-        self._queue = queue.Queue()
+        # deque append/popleft are atomic, the event only wakes the worker
+        self._queue: deque = deque()
+        self._notify = threading.Event()
 
     def start(self) -> None:
         """Start the component's processing thread"""
@@ -26,10 +28,29 @@ class BaseComponent(ABC):
     def stop(self) -> None:
         """Stop the component's processing thread"""
         self.running = False
+        # Wake the worker so it sees running is False without waiting out a timeout
+        self._notify.set()
         if self._thread:
             self._thread.join()
             self._thread = None
 
+    def _enqueue(self, item: Any) -> None:
+        """Queue an item for the worker thread"""
+        self._queue.append(item)
+        self._notify.set()
+
+    def _drain(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Wait for queued items and yield them in order. Without a timeout the
+        worker sleeps until an item is queued or stop() wakes it.
+        """
+        if not self._notify.wait(timeout):
+            return
+        # Cleared before draining, so an item queued meanwhile sets it again
+        self._notify.clear()
+        while self._queue:
+            yield self._queue.popleft()
+
     @abstractmethod
     def _run_worker(self) -> None:
         """Main thread loop - implemented by subclasses"""
@@ -1,9 +1,86 @@
+import glob
+import hashlib
+import inspect
+import json
 import logging
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+import pydantic
 import yaml
+from . import settings
 from .settings import AppConfig
 
+# Use the libyaml backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 
+CONFIG_CACHE_SIZE = 32
+
+# Validated configs by absolute path, with the file's mtime and size
+_config_cache: "OrderedDict[str, Tuple[int, int, AppConfig]]" = OrderedDict()
+
+@lru_cache(maxsize=None)
+def _schema_fingerprint() -> str:
+    """
+    Identify the AppConfig definition a sidecar was pickled with, so a config
+    validated by older code is parsed again instead of being reused
+    """
+    digest = hashlib.sha256(pydantic.VERSION.encode())
+    digest.update(json.dumps(AppConfig.model_json_schema(), sort_keys=True).encode())
+    # Validators and defaults computed in code do not show up in the schema
+    try:
+        digest.update(inspect.getsource(settings).encode())
+    except (OSError, TypeError):
+        pass
+    return digest.hexdigest()[:16]
+
+def _read_sidecar(sidecar_path: str) -> Optional[AppConfig]:
+    """Read a previously validated config, if it was written for this file version"""
+    try:
+        with open(sidecar_path, 'rb') as f:
+            config = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Ignoring unreadable config cache %s: %s", sidecar_path, e)
+        return None
+    return config if isinstance(config, AppConfig) else None
+
+def _write_sidecar(path: str, sidecar_path: str, config: AppConfig) -> None:
+    """Store a validated config next to its file and drop caches of older versions"""
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(config, f, protocol=5)
+        os.replace(tmp_path, sidecar_path)
+        tmp_path = None
+    except Exception as e:
+        # The cache is only an optimization, failing to write it must not fail loading
+        logger.debug("Could not write config cache %s: %s", sidecar_path, e)
+        return
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    for stale_path in glob.glob(f"{glob.escape(path)}.*.pkl"):
+        if stale_path != sidecar_path:
+            try:
+                os.remove(stale_path)
+            except OSError:
+                pass
+
 def load_config(path: str) -> AppConfig:
     """
     Load configuration from a YAML file and return an AppConfig object.
@@ -16,9 +93,29 @@ def load_config(path: str) -> AppConfig:
 
     """
     try:
-        with open(path, 'r', encoding="utf-8") as f:
-            config_dict = yaml.safe_load(f)
-        return AppConfig(**config_dict)
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        cached = _config_cache.get(key)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            _config_cache.move_to_end(key)
+            # Callers fill in settings such as API keys, so hand out copies
+            return cached[2].model_copy(deep=True)
+
+        # A process that starts against an unchanged file and settings module
+        # unpickles the config validated by an earlier run instead of parsing it again
+        sidecar_path = f"{key}.{stat.st_mtime_ns}.{_schema_fingerprint()}.pkl"
+        config = _read_sidecar(sidecar_path)
+        if config is None:
+            with open(key, 'r', encoding="utf-8") as f:
+                config_dict = yaml.load(f, Loader=SafeLoader)
+            config = AppConfig.model_validate(config_dict)
+            _write_sidecar(key, sidecar_path, config)
+
+        _config_cache[key] = (stat.st_mtime_ns, stat.st_size, config)
+        _config_cache.move_to_end(key)
+        if len(_config_cache) > CONFIG_CACHE_SIZE:
+            _config_cache.popitem(last=False)
+        return config.model_copy(deep=True)
     except Exception as e:
         logger.error("Failed to load configuration: %s", e)
         raise
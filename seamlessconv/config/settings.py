@@ -1,17 +1,22 @@
 from typing import Literal, Optional
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-# Validator needs cls to be the first argument, we supress pylint here
-# pylint: disable=no-self-argument,missing-function-docstring,missing-class-docstring
+# pylint: disable=missing-function-docstring,missing-class-docstring
 
-def config_provider_validation(cls, v, values, name: str):
-    if values.get('provider') == name.lower():
-        if v is None:
-            raise ValueError(f"{name} configuration required when provider is '{name.lower()}'")
-    return v
+class ProviderConfig(BaseModel):
+    """A config section where `provider` names the settings field that must be set"""
+    provider: str
+
+    @model_validator(mode='after')
+    def validate_provider_settings(self):
+        if getattr(self, self.provider, None) is None:
+            raise ValueError(
+                f"{self.provider} configuration required when provider is '{self.provider}'"
+            )
+        return self
 
 class OpenAISettings(BaseModel):
-    api_key: Optional[str]
+    api_key: Optional[str] = None
     model: str = "gpt-3.5-turbo"
     temperature: float = Field(default=1.0, ge=0.0, le=2.0)
 
@@ -19,19 +24,11 @@ class LlamaSettings(BaseModel):
     path_to_model: str
     max_tokens: int = Field(default=2048, gt=0)
 
-class LLMConfig(BaseModel):
+class LLMConfig(ProviderConfig):
     provider: Literal["openai", "llama"]
     openai: Optional[OpenAISettings] = None
     llama: Optional[LlamaSettings] = None
 
-    @validator('openai')
-    def validate_openai_config(cls, v, values):
-        return config_provider_validation(cls, v, values, "OpenAI")
-
-    @validator('llama')
-    def validate_llama_config(cls, v, values):
-        return config_provider_validation(cls, v, values, "llama")
-
 
 class VoskSettings(BaseModel):
     path_to_model: str
@@ -56,48 +53,31 @@ class WhisperSettings(BaseModel):
     sample_rate: int
     channels: int
 
-class STTConfig(BaseModel):
+class STTConfig(ProviderConfig):
     provider: Literal["vosk", "whisper"]
     vosk: Optional[VoskSettings] = None
     whisper: Optional[WhisperSettings] = None
 
-    @validator('vosk')
-    def validate_vosk_config(cls, v, values):
-        return config_provider_validation(cls, v, values, "Vosk")
-
-    @validator('whisper')
-    def validate_whisper_config(cls, v, values):
-        return config_provider_validation(cls, v, values, "Whisper")
-
 
 class ElevenlabsSettings(BaseModel):
-    api_key: Optional[str]
+    api_key: Optional[str] = None
 
 class XttsSettings(BaseModel):
     model: str
-    vocoder_path: Optional[str]
-    output_sample_rate: Optional[int]
+    vocoder_path: Optional[str] = None
+    output_sample_rate: Optional[int] = None
     min_word_duration: float
     word_gap: float
     sample_rate: int
 
-class TTSConfig(BaseModel):
+class TTSConfig(ProviderConfig):
     provider: Literal["elevenlabs", "xtts"]
-    elevenlabs: Optional[ElevenlabsSettings]
-    xtts: Optional[XttsSettings]
-
-    @validator('xtts')
-    def validate_xtts_config(cls, v, values):
-        return config_provider_validation(cls, v, values, "Xtts")
-
-    @validator('elevenlabs')
-    def validate_elevenlabs_config(cls, v, values):
-        return config_provider_validation(cls, v, values, "Elevenlabs")
+    elevenlabs: Optional[ElevenlabsSettings] = None
+    xtts: Optional[XttsSettings] = None
 
 class AppConfig(BaseModel):
+    model_config = ConfigDict(extra="forbid")  # prevents additional fields
+
     llm: LLMConfig
     stt: STTConfig
     tts: TTSConfig
-
-    class Config:
-        extra = "forbid"  # prevents additional fields
@@ -1,20 +1,35 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
-@dataclass
+@dataclass(frozen=True)
 class DatabaseConfig:
     host: str = os.getenv('DB_HOST', 'localhost')
     port: int = int(os.getenv('DB_PORT', '5432'))
     user: str = os.getenv('DB_USER', 'postgres')
     password: str = os.getenv('DB_PASSWORD', '')
     database: str = os.getenv('DB_NAME', 'conversation_db')
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: int = 30
+    pool_pre_ping: bool = True
+    pool_recycle: int = 1800
+    query_cache_size: int = 1200
+    _connection_string: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen, so the connection string is built once here
+        object.__setattr__(
+            self,
+            '_connection_string',
+            f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+        )
 
     @property
     def connection_string(self) -> str:
-        return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+        return self._connection_string
 
 @dataclass
 class RedisConfig:
@@ -14,18 +14,132 @@ Example:
     application_id = event_store.create_application('MyApp', 'Category', {})
 """
 
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple, Union
 from uuid import UUID
-from sqlalchemy import create_engine, and_
-from sqlalchemy.orm import declarative_base, sessionmaker, aliased
-from sqlalchemy.sql import select
+from sqlalchemy import (
+    create_engine, and_, or_, bindparam, delete, func, insert, literal, select, update
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker, aliased
 from seamlessconv.database.config import DatabaseConfig
 from seamlessconv.database.models import (
-    Application, Save, Event, EventWitness, Agent, ConversationGroup, Message
+    Application, Save, Event, EventWitness, Agent, ConversationGroup, Message, utcnow, uuid7
+)
+
+# Use orjson for the JSON columns when it is installed
+try:
+    import orjson
+
+    def json_serializer(value: Any) -> str:
+        """Serialize a JSON column value"""
+        return orjson.dumps(value).decode()
+
+    json_deserializer = orjson.loads
+except ImportError:
+    from json import dumps as json_serializer, loads as json_deserializer
+
+ANCESTOR_CACHE_SIZE = 1024
+ANCESTOR_CACHE_TTL = 300
+STREAM_BATCH_SIZE = 500
+# Attempts at inserting messages when a concurrent insert took their sequence numbers
+MESSAGE_INSERT_ATTEMPTS = 5
+MESSAGE_INSERT_BACKOFF = 0.01
+
+_current_session: ContextVar[Optional[Session]] = ContextVar("_current_session", default=None)
+
+EVENT_FIELDS = {
+    "event_id": Event.event_id,
+    "type": Event.event_type,
+    "timestamp": Event.timestamp,
+    "data": Event.data
+}
+
+MESSAGE_FIELDS = {
+    "message_id": Message.message_id,
+    "content": Message.content,
+    "type": Message.message_type,
+    "sequence": Message.sequence_number,
+    "timestamp": Message.timestamp,
+    "context": Message.context,
+    "source_agent_id": Message.source_agent_id
+}
+
+AGENT_FIELDS = {
+    "agent_id": Agent.agent_id,
+    "name": Agent.name,
+    "save_id": Agent.save_id,
+    "created_at": Agent.created_at,
+    "capabilities": Agent.capabilities,
+    "external_application_id": Agent.external_application_id
+}
+
+CONVERSATION_GROUP_FIELDS = {
+    "group_id": ConversationGroup.group_id,
+    "created_event_id": ConversationGroup.created_event_id,
+    "is_active": ConversationGroup.is_active
+}
+
+# Statements for the hot single-row paths are built once and executed with
+# bound values, so they are never rebuilt and always hit the compiled cache
+INSERT_MESSAGE = insert(Message).from_select(
+    [
+        "message_id", "event_id", "group_id", "content", "message_type",
+        "context", "sequence_number", "source_agent_id", "target_agent_id", "timestamp"
+    ],
+    select(
+        bindparam("message_id", type_=Message.message_id.type),
+        bindparam("event_id", type_=Message.event_id.type),
+        bindparam("group_id", type_=Message.group_id.type),
+        bindparam("content", type_=Message.content.type),
+        bindparam("message_type", type_=Message.message_type.type),
+        bindparam("context", type_=Message.context.type),
+        func.coalesce(func.max(Message.sequence_number), -1) + 1,
+        bindparam("source_agent_id", type_=Message.source_agent_id.type),
+        bindparam("target_agent_id", type_=Message.target_agent_id.type),
+        bindparam("timestamp", type_=Message.timestamp.type)
+    )
+    .where(Message.group_id == bindparam("group_id"))
+)
+
+SELECT_APPLICATION_ID_BY_NAME = (
+    select(Application.application_id)
+    .where(Application.name == bindparam("name"))
+)
+
+SELECT_AGENT_ID_BY_APPLICATION_ID = (
+    select(Agent.agent_id)
+    .where(
+        Agent.save_id.in_(bindparam("save_ids", expanding=True)),
+        Agent.external_application_id == bindparam("external_application_id")
+    )
+    .limit(1)
 )
 
-Base = declarative_base()
+SELECT_AGENT_BY_ID = (
+    select(*AGENT_FIELDS.values())
+    .where(
+        Agent.save_id.in_(bindparam("save_ids", expanding=True)),
+        Agent.agent_id == bindparam("agent_id")
+    )
+)
+
+# Recursive CTE of a save and all its ancestors, bound to the "root" save id
+SAVE_CTE = (
+    select(Save.save_id, Save.parent_save_id)
+    .where(Save.save_id == bindparam("root"))
+    .cte(name="save_cte", recursive=True)
+)
+_parent_save = aliased(Save, name="parent_save")
+SAVE_CTE = SAVE_CTE.union_all(
+    select(_parent_save.save_id, _parent_save.parent_save_id)
+    .where(_parent_save.save_id == SAVE_CTE.c.parent_save_id)
+)
 
 class EventStore:
     """
@@ -42,9 +156,48 @@ class EventStore:
     """
 
     def __init__(self, config: DatabaseConfig):
-        self.engine = create_engine(config.connection_string)
-        Base.metadata.create_all(self.engine)
+        self.engine = create_engine(
+            config.connection_string,
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+            pool_timeout=config.pool_timeout,
+            pool_pre_ping=config.pool_pre_ping,
+            pool_recycle=config.pool_recycle,
+            query_cache_size=config.query_cache_size,
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer
+        )
         self.c_session = sessionmaker(bind=self.engine)
+        self._ancestor_cache: Dict[UUID, Tuple[float, Tuple[UUID, ...]]] = {}
+        self._ancestor_lock = threading.Lock()
+
+    @contextmanager
+    def transaction(self) -> Iterator["EventStore"]:
+        """
+        Run the store's writes in one transaction, committed once on exit.
+        Reads outside of write methods still only see committed data.
+        """
+        with self.c_session() as c_session, c_session.begin():
+            token = _current_session.set(c_session)
+            try:
+                yield self
+            finally:
+                _current_session.reset(token)
+
+    @contextmanager
+    def _session(self, session: Optional[Session] = None) -> Iterator[Session]:
+        """Use the given or surrounding transaction's session, else a new one committed on exit."""
+        session = session or _current_session.get()
+        if session is not None:
+            yield session
+            return
+        with self.c_session() as c_session:
+            yield c_session
+            c_session.commit()
+
+    def close(self) -> None:
+        """Close all pooled database connections."""
+        self.engine.dispose()
 
     def get_witnessed_events_by_agent(
         self,
@@ -54,46 +207,81 @@ class EventStore:
         end_time: Optional[datetime] = None,
         event_types: Optional[List[str]] = None,
         limit: Optional[int] = None,
-        witness_types: Optional[List[str]] = None
+        witness_types: Optional[List[str]] = None,
+        fields: Optional[Tuple[str, ...]] = None
     ) -> List[Dict[str, Any]]:
-        """Retrieve events witnessed by an agent with various filters."""
+        """
+        Retrieve events witnessed by an agent with various filters.
+        Only the columns named in fields are loaded, all of them by default.
+        """
+        fields = fields or tuple(EVENT_FIELDS)
         with self.c_session() as c_session:
-            save_cte = self.get_save_cte(save_id)
+            query = self._witnessed_events_query(
+                c_session, save_id, agent_id, start_time, end_time,
+                event_types, limit, witness_types, fields
+            )
+            return [dict(zip(fields, row)) for row in query.all()]
 
-            query = (
-                c_session.query(Event)
-                .join(EventWitness)
-                .filter(
-                    and_(
-                        Event.save_id.in_(select(save_cte.c.save_id)),
-                        EventWitness.agent_id == agent_id
-                    )
-                )
+    def iter_witnessed_events_by_agent(
+        self,
+        save_id: UUID,
+        agent_id: UUID,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        event_types: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        witness_types: Optional[List[str]] = None,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream events witnessed by an agent, one batch of rows at a time."""
+        fields = fields or tuple(EVENT_FIELDS)
+        with self.c_session() as c_session:
+            query = self._witnessed_events_query(
+                c_session, save_id, agent_id, start_time, end_time,
+                event_types, limit, witness_types, fields
             )
+            for row in query.yield_per(STREAM_BATCH_SIZE):
+                yield dict(zip(fields, row))
 
-            if start_time:
-                query = query.filter(Event.timestamp >= start_time)
-            if end_time:
-                query = query.filter(Event.timestamp <= end_time)
-            if event_types:
-                query = query.filter(Event.event_type.in_(event_types))
-            if witness_types:
-                query = query.filter(EventWitness.witness_type.in_(witness_types))
+    def _witnessed_events_query(
+        self,
+        c_session: Session,
+        save_id: UUID,
+        agent_id: UUID,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        event_types: Optional[List[str]],
+        limit: Optional[int],
+        witness_types: Optional[List[str]],
+        fields: Tuple[str, ...]
+    ):
+        """Build the query for events witnessed by an agent."""
+        query = (
+            c_session.query(*(EVENT_FIELDS[field] for field in fields))
+            .select_from(Event)
+            .join(EventWitness)
+            .filter(
+                and_(
+                    Event.save_id.in_(self._get_ancestor_save_ids(save_id)),
+                    EventWitness.agent_id == agent_id
+                )
+            )
+        )
 
-            query = query.order_by(Event.timestamp.desc())
+        if start_time:
+            query = query.filter(Event.timestamp >= start_time)
+        if end_time:
+            query = query.filter(Event.timestamp <= end_time)
+        if event_types:
+            query = query.filter(Event.event_type.in_(event_types))
+        if witness_types:
+            query = query.filter(EventWitness.witness_type.in_(witness_types))
 
-            if limit:
-                query = query.limit(limit)
+        query = query.order_by(Event.timestamp.desc())
 
-            return [
-                {
-                    "event_id": event.event_id,
-                    "type": event.event_type,
-                    "timestamp": event.timestamp,
-                    "data": event.data
-                }
-                for event in query.all()
-            ]
+        if limit:
+            query = query.limit(limit)
+        return query
 
     def get_agent_conversation_history(
         self,
@@ -106,55 +294,89 @@ class EventStore:
     ) -> List[Dict[str, Any]]:
         """Retrieve conversation history visible to an agent."""
         with self.c_session() as c_session:
-            save_cte = self.get_save_cte(save_id)
+            query = self._conversation_history_query(
+                c_session, save_id, agent_id, group_id, start_sequence, message_types, limit
+            )
+            return [dict(zip(MESSAGE_FIELDS, row)) for row in query.all()]
 
-            query = (
-                c_session.query(Message)
-                .join(Event, Message.event_id == Event.event_id)
-                .join(EventWitness, Event.event_id == EventWitness.event_id)
-                .filter(
-                    and_(
-                        Event.save_id.in_(select(save_cte.c.save_id)),
-                        Message.group_id == group_id,
-                        EventWitness.agent_id == agent_id
+    def iter_agent_conversation_history(
+        self,
+        save_id: UUID,
+        agent_id: UUID,
+        group_id: UUID,
+        start_sequence: Optional[int] = None,
+        message_types: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream conversation history visible to an agent."""
+        with self.c_session() as c_session:
+            query = self._conversation_history_query(
+                c_session, save_id, agent_id, group_id, start_sequence, message_types, limit
+            )
+            for row in query.yield_per(STREAM_BATCH_SIZE):
+                yield dict(zip(MESSAGE_FIELDS, row))
+
+    def _conversation_history_query(
+        self,
+        c_session: Session,
+        save_id: UUID,
+        agent_id: UUID,
+        group_id: UUID,
+        start_sequence: Optional[int],
+        message_types: Optional[List[str]],
+        limit: Optional[int]
+    ):
+        """Build the query for the conversation history visible to an agent."""
+        query = (
+            c_session.query(*MESSAGE_FIELDS.values())
+            .select_from(Message)
+            .join(Event, Message.event_id == Event.event_id)
+            .filter(
+                and_(
+                    Event.save_id.in_(self._get_ancestor_save_ids(save_id)),
+                    Message.group_id == group_id,
+                    Message.event_id.in_(
+                        select(EventWitness.event_id)
+                        .where(EventWitness.agent_id == agent_id)
                     )
                 )
             )
+        )
 
-            if start_sequence:
-                query = query.filter(Message.sequence_number >= start_sequence)
-            if message_types:
-                query = query.filter(Message.message_type.in_(message_types))
+        if start_sequence:
+            query = query.filter(Message.sequence_number >= start_sequence)
+        if message_types:
+            query = query.filter(Message.message_type.in_(message_types))
 
-            query = query.order_by(Message.sequence_number)
+        query = query.order_by(Message.sequence_number)
 
-            if limit:
-                query = query.limit(limit)
-
-            return [
-                {
-                    "message_id": msg.message_id,
-                    "content": msg.content,
-                    "type": msg.message_type,
-                    "sequence": msg.sequence_number,
-                    "timestamp": msg.timestamp,
-                    "context": msg.context,
-                    "source_agent_id": msg.source_agent_id
-                }
-                for msg in query.all()
-            ]
+        if limit:
+            query = query.limit(limit)
+        return query
 
     def create_conversation_group(self,event_id: UUID) -> UUID:
         """Create a conversation ogorup"""
-        with self.c_session() as c_session:
+        group_id = uuid7()
+        with self._session() as c_session:
             group = ConversationGroup(
+                group_id=group_id,
                 created_event_id=event_id
             )
 
             c_session.add(group)
-            c_session.commit()
 
-            return group.group_id
+            return group_id
+
+    def close_conversation_groups(self, group_ids: List[UUID]) -> None:
+        """Mark conversation groups as inactive with a single update."""
+        if not group_ids:
+            return
+        with self._session() as c_session:
+            c_session.execute(
+                update(ConversationGroup)
+                .where(ConversationGroup.group_id.in_(group_ids))
+                .values(is_active=False)
+            )
 
     def get_conversation_groups(
         self,
@@ -163,27 +385,18 @@ class EventStore:
     ) -> List[Dict[str, Any]]:
         """Retrieve conversation groups within the save timeline."""
         with self.c_session() as c_session:
-            save_cte = self.get_save_cte(save_id)
-
             query = (
-                c_session.query(ConversationGroup)
+                select(*CONVERSATION_GROUP_FIELDS.values())
                 .join(Event, ConversationGroup.created_event_id == Event.event_id)
-                .filter(
-                    Event.save_id.in_(select(save_cte.c.save_id))
+                .where(
+                    Event.save_id.in_(self._get_ancestor_save_ids(save_id))
                 )
             )
 
             if is_active is not None:
-                query = query.filter(ConversationGroup.is_active == is_active)
+                query = query.where(ConversationGroup.is_active == is_active)
 
-            return [
-                {
-                    "group_id": group.group_id,
-                    "created_event_id": group.created_event_id,
-                    "is_active": group.is_active
-                }
-                for group in query.all()
-            ]
+            return [dict(row) for row in c_session.execute(query).mappings()]
 
     def create_event(
         self,
@@ -193,26 +406,34 @@ class EventStore:
         witnesses: List[Dict[str, Any]]
     ) -> UUID:
         """Create a new event with witnesses."""
-        with self.c_session() as c_session:
-            event = Event(
-                save_id=save_id,
-                event_type=event_type,
-                data=data
+        event_id = uuid7()
+        with self._session() as c_session:
+            c_session.execute(
+                insert(Event).values(
+                    event_id=event_id,
+                    save_id=save_id,
+                    event_type=event_type,
+                    data=data
+                )
             )
-            c_session.add(event)
-            c_session.flush()
-
-            for witness_data in witnesses:
-                witness = EventWitness(
-                    event_id=event.event_id,
-                    agent_id=witness_data['agent_id'],
-                    witness_type=witness_data['witness_type'],
-                    witness_context=witness_data.get('context')
+
+            # Witnesses are write-only here, insert them in one executemany
+            # instead of tracking an ORM object per witness
+            if witnesses:
+                c_session.execute(
+                    insert(EventWitness),
+                    [
+                        {
+                            "event_id": event_id,
+                            "agent_id": witness_data['agent_id'],
+                            "witness_type": witness_data['witness_type'],
+                            "witness_context": witness_data.get('context')
+                        }
+                        for witness_data in witnesses
+                    ]
                 )
-                c_session.add(witness)
 
-            c_session.commit()
-            return event.event_id
+            return event_id
 
     def create_conversation_message(
         self,
@@ -225,68 +446,135 @@ class EventStore:
         target_agent_id: Optional[UUID] = None
     ) -> UUID:
         """Create a new conversation message."""
-        with self.c_session() as c_session:
-            last_sequence = (
-                c_session.query(Message.sequence_number)
-                .filter(Message.group_id == group_id)
-                .order_by(Message.sequence_number.desc())
-                .first()
+        message_id = uuid7()
+        with self._session() as c_session:
+            # Let the database assign the next sequence number in the same
+            # statement as the insert instead of reading it back first
+            self._insert_messages(
+                c_session,
+                {
+                    "message_id": message_id,
+                    "event_id": event_id,
+                    "group_id": group_id,
+                    "content": content,
+                    "message_type": message_type,
+                    "context": context,
+                    "source_agent_id": source_agent_id,
+                    "target_agent_id": target_agent_id,
+                    "timestamp": utcnow()
+                }
             )
-            next_sequence = (last_sequence[0] + 1) if last_sequence else 0
+            return message_id
 
-            message = Message(
-                event_id=event_id,
-                group_id=group_id,
-                content=content,
-                message_type=message_type,
-                context=context,
-                sequence_number=next_sequence,
-                source_agent_id=source_agent_id,
-                target_agent_id=target_agent_id
+    def create_conversation_messages(
+        self,
+        save_id: UUID,
+        messages: List[Dict[str, Any]]
+    ) -> List[UUID]:
+        """
+        Create several messages, each with its own event and witnesses.
+        Every table is written with a single executemany.
+        """
+        event_rows, witness_rows, message_rows = [], [], []
+        for message in messages:
+            event_id = uuid7()
+            event_rows.append({
+                "event_id": event_id,
+                "save_id": save_id,
+                "event_type": message['event_type'],
+                "data": message['data']
+            })
+            witness_rows.extend(
+                {
+                    "event_id": event_id,
+                    "agent_id": witness_data['agent_id'],
+                    "witness_type": witness_data['witness_type'],
+                    "witness_context": witness_data.get('context')
+                }
+                for witness_data in message['witnesses']
             )
-            c_session.add(message)
-            c_session.commit()
-            return message.message_id
+            message_rows.append({
+                "message_id": uuid7(),
+                "event_id": event_id,
+                "group_id": message['group_id'],
+                "content": message['content'],
+                "message_type": message['message_type'],
+                "context": message['context'],
+                "source_agent_id": message.get('source_agent_id'),
+                "target_agent_id": message.get('target_agent_id'),
+                "timestamp": utcnow()
+            })
+
+        if not message_rows:
+            return []
+
+        with self._session() as c_session:
+            c_session.execute(insert(Event), event_rows)
+            if witness_rows:
+                c_session.execute(insert(EventWitness), witness_rows)
+            # A Core executemany runs row by row in order, so each message
+            # sees the sequence numbers assigned to the ones before it
+            self._insert_messages(c_session, message_rows)
+            return [row['message_id'] for row in message_rows]
+
+    @staticmethod
+    def _insert_messages(
+        c_session: Session,
+        rows: Union[Dict[str, Any], List[Dict[str, Any]]]
+    ) -> None:
+        """
+        Insert message rows, retrying if a concurrent insert took the same
+        sequence numbers, which the unique group sequence index rejects.
+        Run as Core on the connection, the ORM would treat the rows as a bulk insert.
+        """
+        for attempt in range(MESSAGE_INSERT_ATTEMPTS):
+            try:
+                with c_session.begin_nested():
+                    c_session.connection().execute(INSERT_MESSAGE, rows)
+                return
+            except IntegrityError:
+                if attempt == MESSAGE_INSERT_ATTEMPTS - 1:
+                    raise
+                # Back off a random amount so racing writers do not collide again
+                time.sleep(random.uniform(0, MESSAGE_INSERT_BACKOFF * (attempt + 1)))
 
     def create_application(self, name: str, dtype: str, config: Dict[str, Any]) -> UUID:
         """Create a new application to store data in"""
-        with self.c_session() as c_session:
+        application_id = uuid7()
+        with self._session() as c_session:
             application = Application(
+                application_id=application_id,
                 name=name,
                 type=dtype,
                 config=config
             )
 
             c_session.add(application)
-            c_session.commit()
 
-            return application.application_id
+            return application_id
 
     def get_application_id_by_name(self, name: str) -> Optional[UUID]:
         """Get the ID for an existing application"""
-        with self.c_session() as c_session:
-            query = (
-                c_session.query(Application)
-                .filter(Application.name == name)
-            ).first()
-
-            if query:
-                return query.application_id
-            return None
+        with self.engine.connect() as conn:
+            return conn.execute(
+                SELECT_APPLICATION_ID_BY_NAME, {"name": name}
+            ).scalar_one_or_none()
 
     def create_save(self, application_id: UUID, name: str, parent_save_id: UUID = None) -> UUID:
         """Create a new save for an application"""
-        with self.c_session() as c_session:
+        save_id = uuid7()
+        with self._session() as c_session:
             save = Save(
+                save_id=save_id,
                 application_id=application_id,
                 parent_save_id=parent_save_id,
                 name=name
             )
 
             c_session.add(save)
-            c_session.commit()
+            self._invalidate_ancestor_cache()
 
-            return save.save_id
+            return save_id
 
     def get_saves_by_application_and_name(
         self,
@@ -296,9 +584,16 @@ class EventStore:
         """Retrieve saves by name"""
         with self.c_session() as c_session:
             query = (
-                c_session.query(Save)
+                select(
+                    Save.save_id,
+                    Save.application_id,
+                    Save.parent_save_id,
+                    Save.name,
+                    Save.timestamp,
+                    Save.state
+                )
                 .join(Application)
-                .filter(
+                .where(
                     and_(
                         Application.name==application_name,
                         Save.name==save_name
@@ -306,17 +601,7 @@ class EventStore:
                 )
             )
 
-            return [
-                {
-                    "save_id": save.save_id,
-                    "application_id": save.application_id,
-                    "parent_save_id": save.parent_save_id,
-                    "name": save.name,
-                    "timestamp": save.timestamp,
-                    "state": save.state
-                }
-                for save in query.all()
-            ]
+            return [dict(row) for row in c_session.execute(query).mappings()]
 
     def create_agent(self,
         name: str,
@@ -324,28 +609,26 @@ class EventStore:
         external_application_id: Optional[str] = None
     ) -> UUID:
         """Create a new Agent for a save"""
-        with self.c_session() as c_session:
+        with self._session() as c_session:
             if external_application_id:
-                save_cte = self.get_save_cte(save_id)
-
-                existing_agent = (
-                    c_session.query(Agent)
-                    .filter(
-                        Agent.save_id.in_(select(save_cte.c.save_id)),
+                existing_agent = c_session.execute(
+                    select(literal(1))
+                    .where(
+                        Agent.save_id.in_(self._get_ancestor_save_ids(save_id)),
                         Agent.external_application_id == external_application_id
                     )
-                    .first()
-                )
-                if existing_agent:
+                    .limit(1)
+                ).scalar()
+                if existing_agent is not None:
                     raise ValueError(f"An Agent with external_application_id\
                                 '{external_application_id}' already exists in the save lineage.")
 
-            agent = Agent(name=name, save_id=save_id)
+            agent_id = uuid7()
+            agent = Agent(agent_id=agent_id, name=name, save_id=save_id)
             if external_application_id:
                 agent.external_application_id = external_application_id
             c_session.add(agent)
-            c_session.commit()
-            return agent.agent_id
+            return agent_id
 
 
     def get_agents(self,
@@ -354,28 +637,17 @@ class EventStore:
     ) -> List[Dict[str, Any]]:
         """Get agents matching the specified criteria."""
         with self.c_session() as c_session:
-            query = c_session.query(Agent)
+            query = select(*AGENT_FIELDS.values())
 
             if save_id:
-                save_cte = self.get_save_cte(save_id)
-                query = query.filter(
-                    Agent.save_id.in_(select(save_cte.c.save_id))
+                query = query.where(
+                    Agent.save_id.in_(self._get_ancestor_save_ids(save_id))
                 )
 
             if name:
-                query = query.filter(Agent.name == name)
+                query = query.where(Agent.name == name)
 
-            return [
-                {
-                    "agent_id": agent.agent_id,
-                    "name": agent.name,
-                    "save_id": agent.save_id,
-                    "created_at": agent.created_at,
-                    "capabilities": agent.capabilities,
-                    "external_application_id": agent.external_application_id
-                }
-                for agent in query.all()
-            ]
+            return [dict(row) for row in c_session.execute(query).mappings()]
 
     def get_agent_id_by_application_id(
         self,
@@ -383,50 +655,38 @@ class EventStore:
         external_application_id: str
     ) -> UUID:
         """Get a specific agent by targeting their application ID"""
-        with self.c_session() as c_session:
-            save_cte = self.get_save_cte(save_id)
-
-            query = (
-                c_session.query(Agent)
-                .filter(
-                    Agent.save_id.in_(select(save_cte.c.save_id)),
-                    Agent.external_application_id == external_application_id
-                )
-            ).first()
-
-            if query:
-                return query.agent_id
-            return None
+        save_ids = self._get_ancestor_save_ids(save_id)
+        with self.engine.connect() as conn:
+            return conn.execute(
+                SELECT_AGENT_ID_BY_APPLICATION_ID,
+                {"save_ids": save_ids, "external_application_id": external_application_id}
+            ).scalar_one_or_none()
 
     def get_agent_by_id(self, save_id: UUID, agent_id: UUID) -> [str, str]:
         """Get agent information by targeting their agent ID"""
-        with self.c_session() as c_session:
-            save_cte = self.get_save_cte(save_id)
-
-            query = (
-                c_session.query(Agent)
-                .filter(
-                    Agent.save_id.in_(select(save_cte.c.save_id)),
-                    Agent.agent_id == agent_id
-                )
+        save_ids = self._get_ancestor_save_ids(save_id)
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                SELECT_AGENT_BY_ID, {"save_ids": save_ids, "agent_id": agent_id}
             ).first()
 
-            if query:
-                return {
-                    "agent_id": query.agent_id,
-                    "name": query.name,
-                    "save_id": query.save_id,
-                    "created_at": query.created_at,
-                    "capabilities": query.capabilities,
-                    "external_application_id": query.external_application_id
-                }
+            if row:
+                return dict(zip(AGENT_FIELDS, row))
             return None
 
     def get_save_timeline(self, save_id: UUID) -> List[Dict[str, Any]]:
         """Get the timeline of saves leading to this save."""
         with self.c_session() as c_session:
+            saves = c_session.execute(
+                select(Save.save_id, Save.parent_save_id, Save.name, Save.timestamp)
+                .join(SAVE_CTE, Save.save_id == SAVE_CTE.c.save_id),
+                {"root": save_id}
+            ).all()
+
+            # The CTE returns the ancestors unordered, walk the parent links to order them
+            saves_by_id = {str(save.save_id): save for save in saves}
             timeline = []
-            current_save = c_session.query(Save).get(save_id)
+            current_save = saves_by_id.get(str(save_id))
 
             while current_save:
                 timeline.append({
@@ -435,69 +695,86 @@ class EventStore:
                     "timestamp": current_save.timestamp
                 })
                 if current_save.parent_save_id:
-                    current_save = c_session.query(Save).get(current_save.parent_save_id)
+                    current_save = saves_by_id.get(str(current_save.parent_save_id))
                 else:
                     break
 
             return timeline
 
-    def get_save_cte(self, save_id: UUID):
-        """Create a recursive CTE to get all ancestor saves."""
-        with self.c_session() as c_session:
-            save_cte = (
-                c_session.query(Save.save_id, Save.parent_save_id)
-                .filter(Save.save_id == save_id)
-                .cte(name='save_cte', recursive=True)
+    def _get_ancestor_save_ids(self, save_id: UUID) -> Tuple[UUID, ...]:
+        """Get the IDs of a save and all its ancestors, cached for ANCESTOR_CACHE_TTL seconds."""
+        session = _current_session.get()
+        if session is not None:
+            # Saves created in the open transaction are only visible to its session
+            return tuple(session.execute(select(SAVE_CTE.c.save_id), {"root": save_id}).scalars())
+
+        now = time.monotonic()
+        with self._ancestor_lock:
+            cached = self._ancestor_cache.get(save_id)
+            if cached and cached[0] > now:
+                return cached[1]
+
+        with self.engine.connect() as conn:
+            save_ids = tuple(
+                conn.execute(select(SAVE_CTE.c.save_id), {"root": save_id}).scalars()
             )
 
-            parent_save = aliased(Save, name="parent_save")
+        with self._ancestor_lock:
+            if len(self._ancestor_cache) >= ANCESTOR_CACHE_SIZE:
+                self._ancestor_cache.pop(next(iter(self._ancestor_cache)))
+            self._ancestor_cache[save_id] = (now + ANCESTOR_CACHE_TTL, save_ids)
+        return save_ids
 
-            save_cte = save_cte.union_all(
-                c_session.query(parent_save.save_id, parent_save.parent_save_id)
-                .filter(parent_save.save_id == save_cte.c.parent_save_id)
-            )
-
-        return save_cte
+    def _invalidate_ancestor_cache(self) -> None:
+        """Drop all cached save ancestries."""
+        with self._ancestor_lock:
+            self._ancestor_cache.clear()
 
     def delete_application(self, application_id: UUID):
         """Delete an application and all associated data."""
-        with self.c_session() as c_session:
-            saves = c_session.query(Save).filter(Save.application_id == application_id).all()
-            for save in saves:
-                self.delete_save(save.save_id, session=c_session)
-            c_session.query(Application).filter(
-                Application.application_id == application_id
-            ).delete()
-            c_session.commit()
+        with self._session() as c_session:
+            self._delete_saves(
+                c_session,
+                select(Save.save_id).where(Save.application_id == application_id)
+            )
+            c_session.execute(
+                delete(Application).where(Application.application_id == application_id)
+            )
+        self._invalidate_ancestor_cache()
 
     def delete_save(self, save_id: UUID, session=None):
         """Delete a save and all associated data."""
-        c_session = session or self.c_session()
-        with c_session:
-            agents = c_session.query(Agent).filter(Agent.save_id == save_id).all()
-            for agent in agents:
-                self.delete_agent(agent.agent_id, session=c_session)
-            events = c_session.query(Event).filter(Event.save_id == save_id).all()
-            for event in events:
-                self.delete_event(event.event_id, session=c_session)
-            c_session.query(Save).filter(Save.save_id == save_id).delete()
-
-            if not session:
-                c_session.commit()
+        with self._session(session) as c_session:
+            self._delete_saves(c_session, select(Save.save_id).where(Save.save_id == save_id))
+        self._invalidate_ancestor_cache()
+
+    def _delete_saves(self, c_session, save_ids):
+        """Delete the selected saves and their data with one statement per table."""
+        event_ids = select(Event.event_id).where(Event.save_id.in_(save_ids))
+        agent_ids = select(Agent.agent_id).where(Agent.save_id.in_(save_ids))
+
+        c_session.execute(
+            delete(EventWitness).where(
+                or_(EventWitness.event_id.in_(event_ids), EventWitness.agent_id.in_(agent_ids))
+            )
+        )
+        c_session.execute(delete(Message).where(Message.event_id.in_(event_ids)))
+        c_session.execute(
+            delete(ConversationGroup).where(ConversationGroup.created_event_id.in_(event_ids))
+        )
+        c_session.execute(delete(Event).where(Event.save_id.in_(save_ids)))
+        c_session.execute(delete(Agent).where(Agent.save_id.in_(save_ids)))
+        c_session.execute(delete(Save).where(Save.save_id.in_(save_ids)))
 
     def delete_agent(self, agent_id: UUID, session=None):
         """Delete an agent."""
-        c_session = session or self.c_session()
-        with c_session:
+        with self._session(session) as c_session:
             c_session.query(EventWitness).filter(EventWitness.agent_id == agent_id).delete()
             c_session.query(Agent).filter(Agent.agent_id == agent_id).delete()
-            if not session:
-                c_session.commit()
 
     def delete_event(self, event_id: UUID, session=None):
         """Delete an event and associated data."""
-        c_session = session or self.c_session()
-        with c_session:
+        with self._session(session) as c_session:
             c_session.query(EventWitness).filter(EventWitness.event_id == event_id).delete()
             c_session.query(Message).filter(Message.event_id == event_id).delete()
             c_session.query(ConversationGroup).filter(
@@ -505,14 +782,10 @@ class EventStore:
             ).delete()
             c_session.query(Event).filter(Event.event_id == event_id).delete()
 
-            if not session:
-                c_session.commit()
-
     def delete_conversation_group(self, group_id: UUID):
         """Delete a conversation group and all associated messages."""
-        with self.c_session() as c_session:
+        with self._session() as c_session:
             c_session.query(Message).filter(Message.group_id == group_id).delete()
             c_session.query(ConversationGroup).filter(
                 ConversationGroup.group_id == group_id
             ).delete()
-            c_session.commit()
@@ -21,8 +21,10 @@ Usage:
     ORM. They define the structure of the database tables and the relationships between them.
 """
 
-from datetime import datetime
-from uuid import uuid4
+import os
+import time
+from datetime import datetime, timezone
+from uuid import UUID
 from sqlalchemy import (
     Column, String, JSON, DateTime, Boolean, Integer, ForeignKey, Index
 )
@@ -31,6 +33,20 @@ from sqlalchemy.dialects.postgresql import UUID as PGUUID
 
 Base = declarative_base()
 
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+    Keys created close together land close together in the primary key indexes.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return UUID(int=value)
+
+def utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime"""
+    return datetime.now(timezone.utc)
+
 class Application(Base):
     """
     Represents an application or environment where events and interactions occur.
@@ -48,7 +64,7 @@ class Application(Base):
     """
     __tablename__ = 'application'
 
-    application_id = Column(PGUUID, primary_key=True, default=uuid4)
+    application_id = Column(PGUUID, primary_key=True, default=uuid7)
     name = Column(String, nullable=False, unique=True)
     type = Column(String, nullable=False)
     config = Column(JSON, nullable=False, default={})
@@ -78,7 +94,7 @@ class Save(Base):
     """
     __tablename__ = 'save'
 
-    save_id = Column(PGUUID, primary_key=True, default=uuid4)
+    save_id = Column(PGUUID, primary_key=True, default=uuid7)
     application_id = Column(PGUUID, ForeignKey('application.application_id'), nullable=False)
     parent_save_id = Column(PGUUID, ForeignKey('save.save_id'), nullable=True)
     name = Column(String, nullable=False)
@@ -112,19 +128,23 @@ class Event(Base):
     """
     __tablename__ = 'event'
 
-    event_id = Column(PGUUID, primary_key=True, default=uuid4)
+    event_id = Column(PGUUID, primary_key=True, default=uuid7)
     save_id = Column(PGUUID, ForeignKey('save.save_id'), nullable=False)
     event_type = Column(String, nullable=False)
-    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow)
+    timestamp = Column(DateTime(timezone=True), nullable=False, default=utcnow)
     data = Column(JSON, nullable=False)
 
     save = relationship("Save", back_populates="events")
-    witnesses = relationship("EventWitness", back_populates="event")
+    witnesses = relationship("EventWitness", back_populates="event", lazy="selectin")
     messages = relationship("Message", back_populates="event")
 
     __table_args__ = (
         Index('idx_event_save_time', save_id, timestamp),
         Index('idx_event_type_time', save_id, event_type, timestamp),
+        Index(
+            'idx_event_time_brin', timestamp,
+            postgresql_using='brin', postgresql_with={'pages_per_range': 32}
+        ),
     )
 
 class EventWitness(Base):
@@ -146,10 +166,10 @@ class EventWitness(Base):
     """
     __tablename__ = 'event_witness'
 
-    witness_id = Column(PGUUID, primary_key=True, default=uuid4)
+    witness_id = Column(PGUUID, primary_key=True, default=uuid7)
     event_id = Column(PGUUID, ForeignKey('event.event_id'), nullable=False)
     agent_id = Column(PGUUID, ForeignKey('agent.agent_id'), nullable=False)
-    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow)
+    timestamp = Column(DateTime(timezone=True), nullable=False, default=utcnow)
     witness_type = Column(String, nullable=False)
     witness_context = Column(JSON, nullable=True)
 
@@ -159,6 +179,7 @@ class EventWitness(Base):
     __table_args__ = (
         Index('idx_witness_event', event_id),
         Index('idx_witness_agent_time', agent_id, timestamp),
+        Index('idx_witness_agent_event', agent_id, event_id),
     )
 
 class Agent(Base):
@@ -178,7 +199,7 @@ class Agent(Base):
     """
     __tablename__ = 'agent'
 
-    agent_id = Column(PGUUID, primary_key=True, default=uuid4)
+    agent_id = Column(PGUUID, primary_key=True, default=uuid7)
     name = Column(String, nullable=False)
     save_id = Column(PGUUID, ForeignKey('save.save_id'), nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -190,7 +211,7 @@ class Agent(Base):
 
     __table_args__ = (
         Index('idx_agent_save', save_id),
-        Index('idx_agent_application', save_id, 'external_application_id', unique=True)
+        Index('idx_agent_application', external_application_id, save_id, unique=True)
     )
 
 class ConversationGroup(Base):
@@ -209,14 +230,16 @@ class ConversationGroup(Base):
     """
     __tablename__ = 'conversation_group'
 
-    group_id = Column(PGUUID, primary_key=True, default=uuid4)
+    group_id = Column(PGUUID, primary_key=True, default=uuid7)
     created_event_id = Column(PGUUID, ForeignKey('event.event_id'), nullable=False)
     is_active = Column(Boolean, nullable=False, default=True)
 
-    messages = relationship("Message", back_populates="group")
+    messages = relationship(
+        "Message", back_populates="group", lazy="selectin", order_by="Message.sequence_number"
+    )
 
     __table_args__ = (
-        Index('idx_conv_active', is_active),
+        Index('idx_conv_active_partial', is_active, postgresql_where=is_active),
     )
 
 class Message(Base):
@@ -240,11 +263,11 @@ class Message(Base):
     """
     __tablename__ = 'message'
 
-    message_id = Column(PGUUID, primary_key=True, default=uuid4)
+    message_id = Column(PGUUID, primary_key=True, default=uuid7)
     event_id = Column(PGUUID, ForeignKey('event.event_id'), nullable=False)
     group_id = Column(PGUUID, ForeignKey('conversation_group.group_id'), nullable=False)
     content = Column(String, nullable=False)
-    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow)
+    timestamp = Column(DateTime(timezone=True), nullable=False, default=utcnow)
     message_type = Column(String, nullable=False)
     context = Column(JSON, nullable=False)
     sequence_number = Column(Integer, nullable=False)
@@ -255,7 +278,14 @@ class Message(Base):
     group = relationship("ConversationGroup", back_populates="messages")
 
     __table_args__ = (
-        Index('idx_message_group_seq', group_id, sequence_number),
+        Index(
+            'idx_message_group_seq', group_id, sequence_number, unique=True,
+            postgresql_include=['message_type', 'timestamp', 'source_agent_id']
+        ),
         Index('idx_message_event', event_id),
         Index('idx_message_type_time', group_id, message_type, timestamp),
+        Index(
+            'idx_message_time_brin', timestamp,
+            postgresql_using='brin', postgresql_with={'pages_per_range': 32}
+        ),
     )
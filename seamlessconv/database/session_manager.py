@@ -1,9 +1,14 @@
 """
 Helper module for managing the database for creation/fetching of data.
 """
-from typing import List, Optional
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 import logging
+import queue
+import threading
+import time
 from sqlalchemy.exc import IntegrityError
 from seamlessconv.database.event_store import EventStore
 from seamlessconv.database.config import DatabaseConfig
@@ -11,6 +16,12 @@ from seamlessconv.event.eventbus import Event
 
 logger = logging.getLogger(__name__)
 
+WRITE_BATCH_SIZE = 64
+# Longest a queued message waits for others to share its batch
+WRITE_BATCH_LATENCY = 0.2
+# Queued by flush() so the writer stops waiting and writes what it has
+_FLUSH = object()
+
 class SessionManager():
     """
     A helper class to manage creation/fetching of data in the database.
@@ -21,6 +32,10 @@ class SessionManager():
         self.save: UUID = None
         self.app_name = None
         self.app_id = None
+        self._write_queue: queue.Queue = queue.Queue()
+        # Started with the first queued message
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
 
     def set_application(
         self,
@@ -101,10 +116,21 @@ class SessionManager():
         )
         return event
 
+    def close(self) -> None:
+        """Write out queued messages and release the database connections held by the store"""
+        if self._writer is not None:
+            self._write_queue.put(None)
+            self._writer.join()
+        self.store.close()
+
     def create_conversation_group(self, event_id) -> UUID:
         """Wrapper method for conversation group creation"""
         return self.store.create_conversation_group(event_id)
 
+    def close_groups(self, group_ids: List[UUID]) -> None:
+        """Wrapper method for closing conversation groups"""
+        self.store.close_conversation_groups(group_ids)
+
     def store_message(self, event: Event, agents) -> (UUID, UUID):
         """
         Stores the event as a message in active application/save.
@@ -119,33 +145,143 @@ class SessionManager():
                 "context": {}
             } for member in agents
         ]
-        new_event = self.store.create_event(
-            save_id=self.save,
-            event_type="talking",
-            data={
+        with self.store.transaction():
+            new_event = self.store.create_event(
+                save_id=self.save,
+                event_type="talking",
+                data={
+                    "source_agent": str(event.agent_id),
+                    "target_agent": ""
+                },
+                witnesses=witnesses
+            )
+
+            return (new_event, self.store.create_conversation_message(
+                event_id=new_event,
+                group_id=event.group_id,
+                content=event.data['text'],
+                message_type=event.data['context']['type'],
+                context={},
+                source_agent_id=event.agent_id
+            ))
+
+    def enqueue_message(self, event: Event, agents) -> None:
+        """
+        Queue the event to be stored as a message in active application/save
+        by the writer thread. Sets agents as witnesses.
+        """
+        if self._writer is None:
+            self._start_writer()
+        self._write_queue.put((self.save, self._message_row(event, agents)))
+
+    def _start_writer(self) -> None:
+        """Start the writer thread unless another caller already did"""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run_writer, daemon=True)
+                self._writer.start()
+
+    def flush(self) -> None:
+        """Wait until every queued message has been written"""
+        if self._writer is not None and self._writer.is_alive():
+            self._write_queue.put(_FLUSH)
+            self._write_queue.join()
+
+    @staticmethod
+    def _message_row(event: Event, agents) -> Dict[str, Any]:
+        """Snapshot what is stored of an event, it may be changed once queued"""
+        return {
+            "event_type": "talking",
+            "data": {
                 "source_agent": str(event.agent_id),
                 "target_agent": ""
             },
-            witnesses=witnesses
-        )
+            "witnesses": [
+                {
+                    "agent_id": member[0],
+                    "witness_type": member[1],
+                    "context": {}
+                } for member in agents
+            ],
+            "group_id": event.group_id,
+            "content": event.data['text'],
+            "message_type": event.data['context']['type'],
+            "context": {},
+            "source_agent_id": event.agent_id
+        }
 
-        return (new_event, self.store.create_conversation_message(
-            event_id=new_event,
-            group_id=event.group_id,
-            content=event.data['text'],
-            message_type=event.data['context']['type'],
-            context={},
-            source_agent_id=event.agent_id
-        ))
+    def _run_writer(self) -> None:
+        """
+        Write queued messages in batches, one insert per table per batch.
+        A batch is written once it is full, its first message has waited
+        WRITE_BATCH_LATENCY, or a flush or close is requested.
+        """
+        while True:
+            batch = [self._write_queue.get()]
+            deadline = time.monotonic() + WRITE_BATCH_LATENCY
+            while len(batch) < WRITE_BATCH_SIZE and batch[-1] is not None and batch[-1] is not _FLUSH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            pending = [item for item in batch if item is not None and item is not _FLUSH]
+            try:
+                for save_id, items in groupby(pending, key=itemgetter(0)):
+                    self._write_rows(save_id, [row for _, row in items])
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+
+            if batch[-1] is None:
+                return
+
+    def _write_rows(self, save_id: UUID, rows: List[Dict[str, Any]]) -> None:
+        """
+        Write message rows in one batch. If the batch fails, retry the rows one
+        by one so a single bad message does not lose the others.
+        """
+        try:
+            self.store.create_conversation_messages(save_id, rows)
+            return
+        except Exception as e:
+            if len(rows) == 1:
+                logger.error("Failed to store message: %s", e)
+                return
+            logger.warning("Failed to store %d messages at once, retrying each: %s", len(rows), e)
+
+        for row in rows:
+            try:
+                self.store.create_conversation_messages(save_id, [row])
+            except Exception as e:
+                logger.error("Failed to store message: %s", e)
 
     def get_messages(self, event: Event, message_types: Optional[List[str]]=None):
         """
         Get messages in specified conversation group from active application/save.
         """
+        return self.get_agent_messages(event.agent_id, event.group_id, message_types)
+
+    def get_agent_messages(
+        self,
+        agent_id: UUID,
+        group_id: UUID,
+        message_types: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the messages an agent witnessed in a conversation group.
+        Waits for queued messages to be written, so do not call it while
+        holding a lock that event handlers need.
+        """
+        # Queued messages are part of the history too
+        self.flush()
         return self.store.get_agent_conversation_history(
             save_id=self.save,
-            agent_id=event.agent_id,
-            group_id=event.group_id,
+            agent_id=agent_id,
+            group_id=group_id,
             message_types=message_types,
         )
 
@@ -1,7 +1,9 @@
 import threading
 import time
 import logging
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from operator import itemgetter
+from dataclasses import dataclass, field, replace
 from typing import Dict, List, Optional, Set, Any, Callable
 from uuid import UUID
 from seamlessconv.event.eventbus import EventBus, Event
@@ -12,7 +14,7 @@ from seamlessconv.database.session_manager import SessionManager
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class DialogueState:
     """Represents the current state of a conversation"""
     current_speaker: Optional[UUID] = None
@@ -20,6 +22,8 @@ class DialogueState:
     context: Dict[str, Any] = field(default_factory=dict)
     current_speech_start: float = 0
     speaking_members: Set[UUID] = field(default_factory=set)
+    speaking_user: Optional[UUID] = None
+    streamed_text: Dict[UUID, List[str]] = field(default_factory=dict)
 
     def is_interrupted(self) -> bool:
         """Check if there's an interruption in the conversation"""
@@ -76,30 +80,34 @@ class DialogueManager:
             return
 
         with self.lock:
-            if self._cancel_eoi_sending(state, group.get_member(event.agent_id), event):
+            agent = group.get_member(event.agent_id)
+            if self._cancel_eoi_sending(state, agent, event):
                 return
-            self._update_speaking_state(state, group, event)
-            self._process_speech_event(state, group, event)
+            self._update_speaking_state(state, agent, event)
+            self._process_speech_event(state, group, agent, event)
             self._notify_llm_members(group, event)
 
     def _update_speaking_state(
         self,
         state: DialogueState,
-        group: ConversationGroup,
+        agent: Optional[Agent],
         event: Event
     ) -> None:
         """Update the current speaking state based on group members"""
-        state.speaking_members = {m.agent_id for m in group.get_speaking_members()}
-
-        # Add user to speaking members if they're the agent
-        agent = group.get_member(event.agent_id)
+        # Agents are added and removed as their speech starts and ends, only
+        # the user is counted as speaking for the duration of their own event
         if agent and agent.is_user:
             state.speaking_members.add(event.agent_id)
+            state.speaking_user = event.agent_id
+        elif state.speaking_user is not None:
+            state.speaking_members.discard(state.speaking_user)
+            state.speaking_user = None
 
     def _process_speech_event(
         self,
         state: DialogueState,
         group: ConversationGroup,
+        agent: Optional[Agent],
         event: Event
     ) -> None:
         """Process speech event including transcription and interruption detection"""
@@ -112,18 +120,42 @@ class DialogueManager:
             event.data['text'] = completed_text
 
         # User is not an LMM Agent, so we manually append sender prefix
-        agent = group.get_member(event.agent_id)
         if agent and agent.is_user:
             event.data['text'] = f"User: {event.data['text']}"
 
         event.data.setdefault('context', {}).update(self._create_interruption_context(state, event))
 
+        stored = self._store_speech(state, event)
+        if stored is None:
+            return
+        for member in group.get_llm_members():
+            member.append_history(stored)
+
+    def _store_speech(self, state: DialogueState, event: Event) -> Optional[Event]:
+        """
+        Store a speech event as a message, returning the event that was stored.
+        Streamed snippets of a response are held back and stored together with
+        the final part as one message, so nothing is stored for them.
+        """
+        if event.type == EventType.TTS_STREAMING_RESPONSE:
+            if event.data['text']:
+                state.streamed_text.setdefault(event.agent_id, []).append(event.data['text'])
+            return None
+
+        streamed = state.streamed_text.pop(event.agent_id, None)
+        if streamed:
+            event = replace(
+                event,
+                data={**event.data, 'text': ' '.join([*streamed, event.data['text']])}
+            )
+
         group_member_ids = self.groups[event.group_id].get_member_ids()
         agents = [(member, "hear") for member in group_member_ids]
-        self.store.store_message(
+        self.store.enqueue_message(
             event=event,
             agents=agents
         )
+        return event
 
     def _cancel_eoi_sending(self, state: DialogueState, agent: Agent, event: Event) -> bool:
         """If user got interrupted, do not notify agents of their EOI"""
@@ -150,18 +182,21 @@ class DialogueManager:
 
     def _notify_llm_members(self, group: ConversationGroup, event: Event) -> None:
         """Notify LLM members about the speech event"""
-        for member in group.get_members():
-            if member.is_user:
-                continue
-            if event.agent_id == member.agent_id and event.data['context'].get('speech_finished'):
+        speech_finished = event.data['context'].get('speech_finished')
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for member in group.get_llm_members():
+            if speech_finished and event.agent_id == member.agent_id:
                 continue
-            logger.debug("Updating member %s", member.agent_id)
+            if debug:
+                logger.debug("Updating member %s", member.agent_id)
             member.update_conversation(event)
 
     @staticmethod
     def _process_transcription(timestamps: List[tuple[str, float]], current_time: float) -> str:
         """Process word timestamps to get the completed sentence up to current time"""
-        return ' '.join(word for word, timestamp in timestamps if timestamp <= current_time)
+        # Word timestamps are in speaking order, so the spoken words are a prefix
+        cut = bisect_right(timestamps, current_time, key=itemgetter(1))
+        return ' '.join(word for word, _ in timestamps[:cut])
 
     def _handle_llm_response(self, event: Event) -> None:
         """Handle response generated by LLM"""
@@ -170,7 +205,9 @@ class DialogueManager:
             agent = group.get_member(event.agent_id)
 
             response_type = event.data['context'].get('type')
-            if response_type == "decision":
+            if event.data['context'].get('error'):
+                agent.handle_llm_error()
+            elif response_type == "decision":
                 self._handle_decision_response(event, agent)
             elif response_type == "response":
                 self._handle_speech_response(state, event)
@@ -179,10 +216,11 @@ class DialogueManager:
 
     def _handle_decision_response(self, event: Event, agent: Agent) -> None:
         """Handle a decision type response from LLM"""
-        self.store.store_message(
+        self.store.enqueue_message(
             event,
             [(event.agent_id, "hear")]
         )
+        agent.append_history(event)
         agent.handle_llm(event)
 
     def _handle_speech_response(self, state: DialogueState, event: Event) -> None:
@@ -245,7 +283,8 @@ class DialogueManager:
         if not text:
             return text
 
-        if ':' in text[:prefix_length]:
-            return text[text.find(':') + 1:].strip()
+        colon = text.find(':', 0, prefix_length)
+        if colon != -1:
+            return text[colon + 1:].strip()
 
         return text.strip()
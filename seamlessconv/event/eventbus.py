@@ -2,14 +2,14 @@ import threading
 import queue
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Callable, Optional
+from typing import Dict, Callable, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID
 from seamlessconv.event.event_types import EventType
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     type: EventType
     agent_id: UUID
@@ -19,8 +19,9 @@ class Event:
 
 class EventBus:
     def __init__(self, max_workers: Optional[int] = None):
-        self._subscribers: Dict[EventType, List[Callable]] = {
-            event_type: [] for event_type in EventType
+        # Subscriber tuples are replaced on change, so dispatch reads them without locking
+        self._subscribers: Dict[EventType, Tuple[Callable, ...]] = {
+            event_type: () for event_type in EventType
         }
         self._subscribers_lock = threading.RLock()
         self._executor = ThreadPoolExecutor(max_workers=max_workers or 4)
@@ -35,21 +36,26 @@ class EventBus:
         while self._running:
             try:
                 event = self._event_queue.get(timeout=0.1)
-                self._dispatch_event(event)
-                self._event_queue.task_done()
             except queue.Empty:
                 continue
-            except Exception as e:
-                logger.error("Error processing event: %s", e)
+
+            # Take everything else already published in one hold of the queue lock
+            with self._event_queue.mutex:
+                events = [event, *self._event_queue.queue]
+                self._event_queue.queue.clear()
+
+            for event in events:
+                try:
+                    self._dispatch_event(event)
+                except Exception as e:
+                    logger.error("Error processing event: %s", e)
+                finally:
+                    self._event_queue.task_done()
 
     def _dispatch_event(self, event: Event):
         """Dispatch a single event to all subscribers"""
-        with self._subscribers_lock:
-            # Create a copy of subscribers to avoid holding the lock during callback execution
-            subscribers = self._subscribers[event.type].copy()
-
         # Execute callbacks
-        for callback in subscribers:
+        for callback in self._subscribers[event.type]:
             try:
                 self._executor.submit(callback, event)
             except Exception as e:
@@ -59,13 +65,16 @@ class EventBus:
         """Subscribe to event"""
         with self._subscribers_lock:
             if callback not in self._subscribers[event_type]:
-                self._subscribers[event_type].append(callback)
+                self._subscribers[event_type] = (*self._subscribers[event_type], callback)
 
     def unsubscribe(self, event_type: EventType, callback: Callable[[Event], None]) -> None:
         """unsubsribe from event"""
         with self._subscribers_lock:
             if callback in self._subscribers[event_type]:
-                self._subscribers[event_type].remove(callback)
+                self._subscribers[event_type] = tuple(
+                    subscriber for subscriber in self._subscribers[event_type]
+                    if subscriber != callback
+                )
 
     def publish(self, event: Event) -> None:
         """Event publication"""
@@ -1,7 +1,9 @@
 from abc import abstractmethod
-import queue
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 import time
 import logging
+from typing import Dict, List, Mapping, Optional, Sequence
+from uuid import UUID
 from seamlessconv.event.eventbus import EventBus, Event
 from seamlessconv.event.event_types import EventType
 from seamlessconv.components.base_component import BaseComponent
@@ -10,39 +12,127 @@ logger = logging.getLogger(__name__)
 
 class BaseLLM(BaseComponent):
     """Base class for Language Model providers"""
+    # Requests in flight at once. Providers whose client can be called from
+    # several threads raise it so one slow request does not hold up the rest
+    MAX_CONCURRENT_REQUESTS = 1
+
     def __init__(self, event_bus: EventBus):
         super().__init__(event_bus)
-        self._queue = queue.Queue()
         self.event_bus.subscribe(EventType.LLM_INPUT_RECEIVED, self._handle_input)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if self.MAX_CONCURRENT_REQUESTS > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS)
+        # Last submitted request per agent, only touched by the worker thread
+        self._in_flight: Dict[UUID, Future] = {}
 
     @abstractmethod
-    def generate_response(self, input_text: str) -> str:
-        """Generate response from input - implemented by providers"""
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        system: Optional[Sequence[Mapping[str, str]]] = None
+    ) -> str:
+        """
+        Generate response from input - implemented by providers.
+
+        The system prompt is passed separately from the conversation messages
+        so providers can keep it as an invariant leading prefix across calls,
+        which is what prompt caching keys on.
+        """
 
     def _handle_input(self, event: Event) -> None:
-        self._queue.put(event)
+        self._enqueue(event)
+
+    @staticmethod
+    def _coalesce(events: List[Event]) -> List[List[Event]]:
+        """
+        Group queued decision requests with identical prompts, ordered by their
+        first request. Such requests would get the same answer, so each group
+        needs a single call. Response requests are always answered one by one.
+        """
+        groups: Dict[object, List[Event]] = {}
+        for event in events:
+            if event.data.get('context', {}).get('type') != 'decision':
+                groups[id(event)] = [event]
+                continue
+            key = (
+                tuple(msg['content'] for msg in event.data.get('system') or ()),
+                tuple((msg['role'], msg['content']) for msg in event.data['messages'])
+            )
+            groups.setdefault(key, []).append(event)
+        return list(groups.values())
+
+    def stop(self) -> None:
+        """Stop the worker thread and wait for requests in flight"""
+        super().stop()
+        if self._executor:
+            self._executor.shutdown(wait=True)
+
+    def _respond(self, requests: List[Event]) -> None:
+        """Generate one response and publish it to every request in the group"""
+        first = requests[0]
+        try:
+            response = self.generate_response(
+                first.data['messages'],
+                first.data.get('system')
+            )
+        except Exception as e:
+            logger.error("LLM request failed for %d requests: %s", len(requests), e)
+            self._publish_failure(requests)
+            return
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                " LLM response type %s: \"%s\" (%d requests)",
+                first.data['context']['type'], response[0:20], len(requests)
+            )
+
+        for event in requests:
+            self.event_bus.publish(Event(
+                type=EventType.LLM_RESPONSE_READY,
+                agent_id=event.agent_id,
+                group_id=event.group_id,
+                timestamp=time.time(),
+                data={'text': response,
+                'context': event.data.get('context', {})}
+            ))
+
+    def _publish_failure(self, requests: List[Event]) -> None:
+        """Tell the requesting agents no response is coming, so they stop waiting for it"""
+        for event in requests:
+            self.event_bus.publish(Event(
+                type=EventType.LLM_RESPONSE_READY,
+                agent_id=event.agent_id,
+                group_id=event.group_id,
+                timestamp=time.time(),
+                data={'text': '',
+                'context': {**event.data.get('context', {}), 'error': True}}
+            ))
+
+    def _respond_after(self, previous: List[Future], requests: List[Event]) -> None:
+        """Respond once the agents' earlier requests are answered, keeping their order"""
+        wait(previous)
+        self._respond(requests)
+
+    def _submit(self, requests: List[Event]) -> None:
+        """
+        Run a request group on the pool, chained after any request in flight
+        for the same agents. The pool takes tasks in order, so the requests
+        waited on are already running and never behind the waiting one.
+        """
+        self._in_flight = {
+            agent_id: future for agent_id, future in self._in_flight.items()
+            if not future.done()
+        }
+        agent_ids = {event.agent_id for event in requests}
+        previous = [self._in_flight[agent_id] for agent_id in agent_ids if agent_id in self._in_flight]
+        future = self._executor.submit(self._respond_after, previous, requests)
+        for agent_id in agent_ids:
+            self._in_flight[agent_id] = future
 
     def _run_worker(self) -> None:
         while self.running:
-            try:
-                event = self._queue.get(timeout=0.1)
-                input_text = event.data['text']
-                context = event.data.get('context', {})
-
-                response = self.generate_response(input_text)
-
-                logger.debug(
-                    " LLM response type %s: \"%s\"",
-                    event.data['context']['type'], response[0:20]
-                )
-
-                self.event_bus.publish(Event(
-                    type=EventType.LLM_RESPONSE_READY,
-                    agent_id=event.agent_id,
-                    group_id=event.group_id,
-                    timestamp=time.time(),
-                    data={'text': response,
-                    'context': context}
-                ))
-            except queue.Empty:
-                continue
+            for requests in self._coalesce(list(self._drain())):
+                if self._executor:
+                    self._submit(requests)
+                else:
+                    self._respond(requests)
@@ -1,12 +1,19 @@
+import functools
 import logging
+import mmap
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=None)
 def load_prompt(file_path: str) -> str:
     """Loads specified file and returns its text contents"""
     try:
-        with open(file_path, mode='r') as file:
-            prompt = file.read()
+        with open(file_path, mode='rb') as file:
+            # mmap cannot map an empty file
+            if not file.seek(0, 2):
+                return ""
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                prompt = mapped[:].decode('utf-8')
     except IOError as ioe:
         logger.error(f"Error opening the prompt file {file_path}: {ioe}")
     return prompt
\ No newline at end of file
@@ -1,4 +1,5 @@
 from openai import OpenAI
+import httpx
 import logging
 from seamlessconv.event.eventbus import EventBus
 from ..base_llm import BaseLLM
@@ -7,22 +8,40 @@ from ...config.settings import OpenAISettings
 logger = logging.getLogger(__name__)
 
 class OpenAIProvider(BaseLLM):
+    # The client and its connection pool are safe to share between threads
+    MAX_CONCURRENT_REQUESTS = 8
+
     def __init__(self, event_bus: EventBus, settings: OpenAISettings):
         super().__init__(event_bus)
         self.settings = settings
-        self.client = OpenAI(api_key=self.settings.api_key)
+        self.client = None
+        self.setup()
 
     def setup(self):
+        # One client for the provider's lifetime, so its kept-alive HTTP/2
+        # connection is reused between requests instead of a new TLS handshake
+        if self.client is not None:
+            return
         try:
-            self.client = OpenAI(api_key=self.settings.api_key)
+            self.client = OpenAI(
+                api_key=self.settings.api_key,
+                http_client=httpx.Client(
+                    http2=True,
+                    timeout=30.0,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40)
+                )
+            )
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI client: {e}")
             raise RuntimeError("OpenAI initialization failed") from e
 
-    def generate_response(self, messages):        
+    def generate_response(self, messages, system=None):
+        # System prompt goes first and unchanged, so OpenAI's automatic
+        # prefix caching can reuse it between turns. The shared prompt is
+        # read-only, so it is copied into plain dicts for serialization.
         try:
             response = self.client.chat.completions.create(
-                messages=messages,
+                messages=[*map(dict, system or ()), *messages],
                 model=self.settings.model,
                 temperature=self.settings.temperature
             )
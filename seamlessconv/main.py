@@ -1,5 +1,6 @@
 import os
-import time
+import signal
+import threading
 import argparse
 import logging
 from seamlessconv.config.loader import load_config
@@ -110,16 +111,20 @@ def main():
     llm_provider.start()
     tts_provider.start()
 
-    try:
-        while True:
-            time.sleep(0.1)
-
-    except KeyboardInterrupt:
-        logging.info("Recieved KeyboardInterrupt, stopping.")
-        stt_provider.stop()
-        llm_provider.stop()
-        tts_provider.stop()
-        event_bus.shutdown()
+    # Block until Ctrl+C without waking up periodically. Windows only runs
+    # the signal handler between timed waits, so it still polls once a second.
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    timeout = None if hasattr(signal, 'pause') else 1.0
+    while not stop_event.wait(timeout):
+        pass
+
+    logging.info("Recieved KeyboardInterrupt, stopping.")
+    stt_provider.stop()
+    llm_provider.stop()
+    tts_provider.stop()
+    event_bus.shutdown()
+    store.close()
 
 if __name__ == "__main__":
     main()
@@ -1,13 +1,15 @@
 from dataclasses import dataclass
 from typing import Optional
 import threading
-import queue
+import time
 import logging
 import sounddevice as sd
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+AUDIO_SLOTS = 32
+
 @dataclass
 class AudioConfig:
     sample_rate: int = 16000
@@ -20,7 +22,15 @@ class AudioInput:
 
     def __init__(self, config: AudioConfig):
         self.config = config
-        self.input_queue = queue.Queue()
+        # Single producer, single consumer ring of preallocated blocks: the
+        # callback only writes into a free slot and advances _head, the
+        # reader advances _tail, so neither side takes a lock or allocates
+        self._pool: Optional[np.ndarray] = None
+        self._frames = [0] * AUDIO_SLOTS
+        self._head = 0
+        self._tail = 0
+        # Set by the callback after each block so the reader can sleep until one arrives
+        self._available = threading.Event()
         self._stream = Optional[sd.RawInputStream]
         self._running = False
         self._lock = threading.Lock()
@@ -35,12 +45,26 @@ class AudioInput:
         """Callback for the sounddevice input stream"""
         if status:
             logger.warning("Audio callback status: %s", status)
-        self.input_queue.put((indata.copy()))
+        # Keep one slot free for the block the reader is still processing
+        if self._head - self._tail >= AUDIO_SLOTS - 1:
+            logger.warning("Audio input buffer full, dropping block")
+            return
+        slot = self._head % AUDIO_SLOTS
+        np.copyto(self._pool[slot, :frames], indata)
+        self._frames[slot] = frames
+        self._head += 1
+        self._available.set()
 
     def start(self) -> None:
         """Start the audio input stream"""
         with self._lock:
             if not self._running:
+                self._pool = np.empty(
+                    (AUDIO_SLOTS, self.config.blocksize, self.config.channels),
+                    dtype=self.config.dtype
+                )
+                self._head = 0
+                self._tail = 0
                 self._stream = sd.InputStream(
                     samplerate=self.config.sample_rate,
                     dtype=self.config.dtype,
@@ -62,8 +86,34 @@ class AudioInput:
                 self._running = False
 
     def get_audio_block(self, timeout: Optional[float] = None):
-        """Get the next block of audio data"""
-        try:
-            return self.input_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        """Get the next block of audio data, valid until the following call"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._tail == self._head:
+            # Cleared before rechecking, so a block added meanwhile sets it again
+            self._available.clear()
+            if self._tail != self._head:
+                break
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            self._available.wait(remaining)
+        slot = self._tail % AUDIO_SLOTS
+        block = self._pool[slot, :self._frames[slot]]
+        self._tail += 1
+        return block
+
+    def get_audio_blocks(self, timeout: Optional[float] = None):
+        """Get every pending block of audio data joined into one array"""
+        block = self.get_audio_block(timeout)
+        if block is None or self._tail == self._head:
+            return block
+        # Copy the blocks out before releasing their slots to the callback
+        head = self._head
+        blocks = [block]
+        blocks.extend(
+            self._pool[slot % AUDIO_SLOTS, :self._frames[slot % AUDIO_SLOTS]]
+            for slot in range(self._tail, head)
+        )
+        audio_data = np.concatenate(blocks)
+        self._tail = head
+        return audio_data
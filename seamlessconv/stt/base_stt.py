@@ -1,6 +1,5 @@
 from abc import abstractmethod
 from typing import Optional
-import queue
 import time
 import logging
 import numpy as np
@@ -51,6 +50,22 @@ class BaseSTT(BaseComponent):
                 }
             ))
 
+    def _publish_transcription(self, text: str) -> None:
+        """Publish transcribed text to event bus"""
+        self.time_since_last_eoi = time.time()
+        self.send_eoi = True
+        logger.debug(text)
+        self.event_bus.publish(Event(
+            type=EventType.STT_TRANSCRIPTION_READY,
+            agent_id= self.agent_id,
+            group_id= self.group_id,
+            timestamp=time.time(),
+            data={
+                'text': text,
+                'context': {'type': 'response'}
+                }
+        ))
+
     def _handle_user_update_data(self, event: Event) -> None:
         self.agent_id = event.agent_id
         self.group_id = event.group_id
@@ -67,27 +82,13 @@ class BaseSTT(BaseComponent):
 
         while self.running:
             self._send_eoi()
-            try:
-                audio_data = self.audio_input.get_audio_block(0.1)
-                # Check if audio_data exists and has content
-                if audio_data is not None and isinstance(audio_data, np.ndarray) and audio_data.size > 0:
-                    text = self.process_audio(audio_data)
-                    if text:
-                        self.time_since_last_eoi = time.time()
-                        self.send_eoi = True
-                        logger.debug(text)
-                        self.event_bus.publish(Event(
-                            type=EventType.STT_TRANSCRIPTION_READY,
-                            agent_id= self.agent_id,
-                            group_id= self.group_id,
-                            timestamp=time.time(),
-                            data={
-                                'text': text,
-                                'context': {'type': 'response'}
-                                }
-                        ))
-
-            except queue.Empty:
-                continue
+            # Take everything queued so a slow transcription is followed
+            # by one call over the backlog instead of one per block
+            audio_data = self.audio_input.get_audio_blocks(0.1)
+            # Check if audio_data exists and has content
+            if audio_data is not None and isinstance(audio_data, np.ndarray) and audio_data.size > 0:
+                text = self.process_audio(audio_data)
+                if text:
+                    self._publish_transcription(text)
 
         self.audio_input.stop()
@@ -1,13 +1,14 @@
 from seamlessconv.config.settings import STTConfig
 from seamlessconv.event.eventbus import EventBus
-from .providers.vosk_provider import VoskProvider
-from .providers.whipser_provider import WhisperProvider
 
 class STTFactory:
     @staticmethod
     def create(event_bus: EventBus, config: STTConfig):
+        # Providers are imported on demand, each loads its own speech model library
         if config.provider == "vosk":
+            from .providers.vosk_provider import VoskProvider
             return VoskProvider(event_bus, config.vosk)
         elif config.provider == "whisper":
+            from .providers.whipser_provider import WhisperProvider
             return WhisperProvider(event_bus, config.whisper)
         raise ValueError(f"Unknown STT provider: {config.provider}")
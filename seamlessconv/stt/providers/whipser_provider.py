@@ -1,7 +1,10 @@
 import io
 import logging
+import os
+import threading
 import wave
-from typing import Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Optional, List, Tuple
 from collections import deque
 from dataclasses import dataclass
 import numpy as np
@@ -12,6 +15,10 @@ from ..base_stt import BaseSTT
 
 logger = logging.getLogger(__name__)
 
+INT16_SCALE = 1.0 / np.iinfo(np.int16).max
+MAX_PENDING_TRANSCRIPTIONS = 2
+WHISPER_CPU_THREADS = 4
+
 @dataclass
 class TranscriptionSegment:
     text: str
@@ -20,18 +27,31 @@ class TranscriptionSegment:
 
 class TranscriptionContext:
     def __init__(self, max_history: int = 5):
-        self.segments: List[TranscriptionSegment] = []
+        self.segments: Deque[TranscriptionSegment] = deque(maxlen=max_history)
         self.last_timestamp: float = 0
         self.max_history = max_history
+        self._recent_text: Optional[str] = None
+        self._prompt_tokens: Optional[List[int]] = None
 
     def add_segment(self, text: str, start_time: float, end_time: float):
         self.segments.append(TranscriptionSegment(text, start_time, end_time))
-        if len(self.segments) > self.max_history:
-            self.segments.pop(0)
         self.last_timestamp = end_time
+        self._recent_text = None
+        self._prompt_tokens = None
 
     def get_recent_text(self) -> str:
-        return " ".join(segment.text for segment in self.segments)
+        if self._recent_text is None:
+            self._recent_text = " ".join(segment.text for segment in self.segments)
+        return self._recent_text
+
+    def get_prompt_tokens(self, tokenizer) -> List[int]:
+        """Get the recent text encoded the way faster-whisper encodes an initial prompt"""
+        if self._prompt_tokens is None:
+            text = self.get_recent_text().strip()
+            self._prompt_tokens = (
+                tokenizer.encode(" " + text, add_special_tokens=False).ids if text else []
+            )
+        return self._prompt_tokens
 
 class AudioProcessor:
     def __init__(self, 
@@ -45,17 +65,58 @@ class AudioProcessor:
         self.recording = False
         self.recording_start_time = 0
         self.audio_buffer = []
-        self.chunk_buffer = []
+        self.chunk_buffer: Optional[np.ndarray] = None
+        self.buffer_start = 0
+        self.buffer_end = 0
         self.processed_duration = 0
         self.chunk_samples = None
+        self.float_buffer: Optional[np.ndarray] = None
 
     def initialize_chunk_size(self, sample_rate: int):
         """Calculate chunk size based on desired duration and sample rate"""
         self.chunk_samples = int(self.chunk_duration * sample_rate)
 
+    def buffer_audio(self, audio_chunk: np.ndarray):
+        """Append samples to the preallocated chunk buffer"""
+        n_samples = len(audio_chunk)
+        if self.chunk_buffer is None:
+            self.chunk_buffer = np.empty(
+                (self.chunk_samples * 2,) + audio_chunk.shape[1:],
+                dtype=audio_chunk.dtype
+            )
+
+        if self.buffer_end + n_samples > len(self.chunk_buffer):
+            # Move the samples not yet returned to the front, growing the
+            # buffer only when a block is larger than the free space
+            pending = self.buffer_end - self.buffer_start
+            residual = self.chunk_buffer[self.buffer_start:self.buffer_end]
+            if pending + n_samples > len(self.chunk_buffer):
+                grown = np.empty(
+                    (pending + n_samples,) + self.chunk_buffer.shape[1:],
+                    dtype=self.chunk_buffer.dtype
+                )
+                grown[:pending] = residual
+                self.chunk_buffer = grown
+            else:
+                np.copyto(self.chunk_buffer[:pending], residual)
+            self.buffer_start = 0
+            self.buffer_end = pending
+
+        self.chunk_buffer[self.buffer_end:self.buffer_end + n_samples] = audio_chunk
+        self.buffer_end += n_samples
+
+    def to_float(self, audio_data: np.ndarray) -> np.ndarray:
+        """Scale int16 samples to floats in a reused buffer, valid until the next call"""
+        n_samples = audio_data.size
+        if self.float_buffer is None or len(self.float_buffer) < n_samples:
+            self.float_buffer = np.empty(n_samples, dtype=np.float32)
+        float_data = self.float_buffer[:n_samples].reshape(audio_data.shape)
+        np.multiply(audio_data, np.float32(INT16_SCALE), out=float_data)
+        return float_data
+
     def calculate_energy(self, audio_data: np.ndarray) -> float:
-        float_data = audio_data.astype(np.float32) / np.iinfo(np.int16).max
-        return np.sqrt(np.mean(float_data**2))
+        float_data = self.to_float(audio_data)
+        return np.sqrt(np.mean(np.square(float_data)))
 
     def is_silence(self) -> bool:
         if len(self.silence_frames) < self.silence_frames.maxlen:
@@ -63,14 +124,25 @@ class AudioProcessor:
         recent_energy = np.mean(list(self.silence_frames))
         return recent_energy < self.energy_threshold
 
-    def is_speech(self, audio_data: np.ndarray, sample_rate: int) -> bool:
-        float_data = audio_data.astype(np.float32) / np.iinfo(np.int16).max
+    def calculate_window_energies(self, audio_data: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Calculate the RMS energy of every 20ms window"""
+        # Lay the windows out as rows so all their energies are computed
+        # in one vectorized pass instead of one NumPy call per window
         window_size = int(sample_rate * 0.02)
-        windows = np.array_split(float_data, len(float_data) // window_size)
-        energies = [np.sqrt(np.mean(window**2)) for window in windows if len(window) == window_size]
-        speech_duration = sum(1 for energy in energies if energy > self.energy_threshold) * 0.02
+        samples = audio_data.reshape(-1)
+        n_windows = len(samples) // window_size
+        windows = samples[:n_windows * window_size].reshape(n_windows, window_size)
+        float_windows = self.to_float(windows)
+        # Per-row sum of squares without materializing the squared windows
+        return np.sqrt(np.einsum('ij,ij->i', float_windows, float_windows) / window_size)
+
+    def has_speech(self, energies: np.ndarray) -> bool:
+        speech_duration = np.count_nonzero(energies > self.energy_threshold) * 0.02
         return speech_duration >= self.min_speech_duration
 
+    def is_speech(self, audio_data: np.ndarray, sample_rate: int) -> bool:
+        return self.has_speech(self.calculate_window_energies(audio_data, sample_rate))
+
     def process_chunk(
         self,
         audio_chunk: np.ndarray,
@@ -80,27 +152,42 @@ class AudioProcessor:
         if self.chunk_samples is None:
             self.initialize_chunk_size(sample_rate)
 
-        self.chunk_buffer.extend(audio_chunk)
+        self.buffer_audio(audio_chunk)
 
-        if len(self.chunk_buffer) >= self.chunk_samples:
-            # Extract the complete chunk
-            complete_chunk = np.array(self.chunk_buffer[:self.chunk_samples])
-            # Keep remaining samples
-            self.chunk_buffer = self.chunk_buffer[self.chunk_samples:]
+        n_chunks = (self.buffer_end - self.buffer_start) // self.chunk_samples
+        if n_chunks:
+            # Blocks arrive coalesced when the worker falls behind, so take
+            # every complete chunk at once. The result is a view into the
+            # buffer, it stays valid until the next call buffers more audio
+            chunk_end = self.buffer_start + n_chunks * self.chunk_samples
+            complete_chunk = self.chunk_buffer[self.buffer_start:chunk_end]
+            self.buffer_start = chunk_end
 
-            current_energy = self.calculate_energy(complete_chunk)
-            self.silence_frames.append(current_energy)
+            # One pass over the samples serves both the silence tracking and
+            # the speech check, the chunk RMS follows from the window energies
+            energies = self.calculate_window_energies(complete_chunk, sample_rate)
+            self.silence_frames.append(np.sqrt(np.mean(np.square(energies))))
 
             chunk_start_time = self.processed_duration
-            chunk_end_time = chunk_start_time + self.chunk_duration
+            chunk_end_time = chunk_start_time + n_chunks * self.chunk_duration
             self.processed_duration = chunk_end_time
 
             # If chunk contains speech, return it for processing
-            if self.is_speech(complete_chunk, sample_rate):
+            if self.has_speech(energies):
                 return complete_chunk, chunk_start_time, chunk_end_time
 
         return None, 0, 0
 
+    def create_float_audio(self, audio_data: np.ndarray, channels: int) -> np.ndarray:
+        """Convert int16 samples to the mono float32 array Whisper decodes to"""
+        float_data = audio_data.reshape(-1, channels).astype(np.float32)
+        if channels > 1:
+            float_data = float_data.mean(axis=1)
+        else:
+            float_data = float_data.reshape(-1)
+        float_data *= 1.0 / 32768.0
+        return float_data
+
     def create_wav_buffer(
         self,
         audio_data: np.ndarray,
@@ -125,41 +212,112 @@ class WhisperProvider(BaseSTT):
             config.min_duration
         )
 
+        compute_type = self._resolve_compute_type(config.device, config.compute_type)
+        logger.debug("Loading Whisper %s on %s with %s", config.size_model, config.device, compute_type)
+        # Transcription runs on a single thread, so one CTranslate2 worker
+        # with a few intra-op threads avoids oversubscribing the CPU
         self.model = WhisperModel(
             config.size_model,
             device=config.device,
-            compute_type=config.compute_type
+            compute_type=compute_type,
+            cpu_threads=min(WHISPER_CPU_THREADS, os.cpu_count() or 1),
+            num_workers=1
         )
         self.context = TranscriptionContext()
+        # Arrays skip the WAV encode and decode, but faster-whisper only
+        # resamples audio it decodes itself
+        self.pass_raw_audio = config.sample_rate == self.model.feature_extractor.sampling_rate
+        # Transcription runs on its own thread so audio keeps being captured
+        # and gated meanwhile. Utterances beyond the limit are held back and
+        # merged into one, which is submitted once a transcription finishes
+        self._transcriber = ThreadPoolExecutor(max_workers=1)
+        self._transcription_slots = threading.Semaphore(MAX_PENDING_TRANSCRIPTIONS)
+        self._held_audio: Optional[np.ndarray] = None
+        self._held_start = 0.0
+        self._held_end = 0.0
+
+    @staticmethod
+    def _resolve_compute_type(device: str, compute_type: str) -> str:
+        """Pick the quantized compute type for the device when none is configured"""
+        if compute_type != "default":
+            return compute_type
+        return "int8" if device == "cpu" else "float16"
 
     def process_audio(self, audio_data: np.ndarray) -> Optional[str]:
-        """Process a single chunk of audio data with context"""
+        """Process a single chunk of audio data, queueing utterances for transcription"""
         complete_utterance, start_time, end_time = self.audio_processor.process_chunk(
             audio_data, 
             self.config.sample_rate
         )
 
+        # process_chunk only returns chunks that already passed is_speech
         if complete_utterance is not None:
-            if self.audio_processor.is_speech(complete_utterance, self.config.sample_rate):
-                wav_buffer = self.audio_processor.create_wav_buffer(
-                    complete_utterance,
-                    self.config.sample_rate,
-                    self.config.channels
-                )
+            if self._held_audio is None:
+                if self._transcription_slots.acquire(blocking=False):
+                    self._submit(complete_utterance, start_time, end_time)
+                    return None
+                logger.debug("Transcription backlog full, holding back %.1fs of audio", end_time - start_time)
+                # Copy, the utterance is a view into the chunk buffer
+                self._held_audio = complete_utterance.copy()
+                self._held_start = start_time
+            else:
+                self._held_audio = np.concatenate((self._held_audio, complete_utterance))
+            self._held_end = end_time
 
-                prompt = self.context.get_recent_text()
-                segments, _ = self.model.transcribe(
-                    wav_buffer,
-                    initial_prompt=prompt if prompt else None
-                )
+        # Checked on every block, so held back audio follows as soon as a slot frees up
+        if self._held_audio is not None and self._transcription_slots.acquire(blocking=False):
+            self._submit_held_audio()
+
+        return None
 
-                text = " ".join(segment.text.strip() for segment in segments if segment.text.strip())
+    def _submit(self, utterance: np.ndarray, start_time: float, end_time: float) -> None:
+        """Queue an utterance for transcription, a slot must already be acquired"""
+        # Both conversions copy, so the utterance may be a view into the chunk buffer
+        if self.pass_raw_audio:
+            audio = self.audio_processor.create_float_audio(
+                utterance,
+                self.config.channels
+            )
+        else:
+            audio = self.audio_processor.create_wav_buffer(
+                utterance,
+                self.config.sample_rate,
+                self.config.channels
+            )
+        self._transcriber.submit(self._transcribe, audio, start_time, end_time)
 
-                if text:
-                    self.context.add_segment(text, start_time, end_time)
-                    return text
+    def _submit_held_audio(self) -> None:
+        """Queue the held back utterances as one, a slot must already be acquired"""
+        audio = self._held_audio
+        self._held_audio = None
+        self._submit(audio, self._held_start, self._held_end)
 
-        return None
+    def _transcribe(self, audio, start_time: float, end_time: float) -> None:
+        """Transcribe an utterance with context and publish the text"""
+        try:
+            prompt = self.context.get_prompt_tokens(self.model.hf_tokenizer)
+            segments, _ = self.model.transcribe(
+                audio,
+                initial_prompt=prompt if prompt else None
+            )
+
+            text = " ".join(segment.text.strip() for segment in segments if segment.text.strip())
+
+            if text:
+                self.context.add_segment(text, start_time, end_time)
+                self._publish_transcription(text)
+        except Exception as e:
+            logger.error("Transcription failed: %s", e)
+        finally:
+            self._transcription_slots.release()
+
+    def stop(self) -> None:
+        """Stop capturing audio and wait for queued transcriptions"""
+        super().stop()
+        if self._held_audio is not None:
+            self._transcription_slots.acquire()
+            self._submit_held_audio()
+        self._transcriber.shutdown(wait=True)
 
     def get_full_transcript(self) -> str:
         """Get the complete transcript with all context"""
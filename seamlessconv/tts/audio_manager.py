@@ -12,7 +12,7 @@ from seamlessconv.event.event_types import EventType
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class AudioContext:
     """Data class to store audio context information"""
     original_text: str
@@ -24,7 +24,8 @@ class AudioContext:
 
 class AudioPlayer:
     """Handles playing of individual audio streams"""
-    CHUNK_SIZE = 1024
+    # Seconds of audio per blocking write, short enough to stop promptly
+    CHUNK_DURATION = 0.25
     PUBLISH_INTERVAL = 3
 
     def __init__(self, audio_data: bytes, event: Event, context: AudioContext, event_bus: EventBus, on_finished_callback: callable):
@@ -113,7 +114,8 @@ class AudioPlayer:
 
     def _play_audio(self) -> None:
         """Internal method to handle audio playback"""
-        data = self.wf.readframes(self.CHUNK_SIZE)
+        chunk_frames = int(self.wf.getframerate() * self.CHUNK_DURATION)
+        data = self.wf.readframes(chunk_frames)
 
         while data and self.playing:
             current_time = time.time()
@@ -123,7 +125,7 @@ class AudioPlayer:
                 self._publish_snippet()
 
             self.stream.write(data)
-            data = self.wf.readframes(self.CHUNK_SIZE)
+            data = self.wf.readframes(chunk_frames)
 
         if self.playing:
             self.stop(False)
@@ -1,5 +1,5 @@
-import queue
 import logging
+import struct
 from typing import Union, List, Dict, Tuple
 from abc import abstractmethod
 from seamlessconv.config.settings import TTSConfig
@@ -22,22 +22,29 @@ class BaseTTS(BaseComponent):
     def synthesize_speech(self, text: str) -> Tuple[bytes, Dict[str, List[Union[str, float]]]]:
         """Convert text to audio data - implemented by providers"""
 
+    @staticmethod
+    def encode_wav(pcm_data: bytes, sample_rate: int) -> bytes:
+        """Wrap mono 16-bit PCM samples in a WAV header"""
+        header = struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36 + len(pcm_data), b'WAVE',
+            b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+            b'data', len(pcm_data)
+        )
+        return header + pcm_data
+
     def _handle_speech_request(self, event: Event) -> None:
-        self._queue.put(event)
+        self._enqueue(event)
 
     def _handle_speech_interruption(self, event: Event) -> None:
         self.audio_manager.stop_player(event)
 
     def _run_worker(self) -> None:
         while self.running:
-            try:
-                event = self._queue.get(timeout=0.1)
+            for event in self._drain():
                 text = event.data['text']
                 synthesized_speech = self.synthesize_speech(text)
                 audio_data = synthesized_speech[0]
                 word_timestamps = synthesized_speech[1]
                 self.audio_manager.add_player(event, audio_data, word_timestamps, text)
                 self.audio_manager.play_player(event)
-
-            except queue.Empty:
-                continue
@@ -1,19 +1,18 @@
 import os
 from seamlessconv.config.settings import TTSConfig
 from seamlessconv.event.eventbus import EventBus
-from .providers.elevenlabs_provider import ElevenLabsTTSProvider
-from .providers.xtts_provider import XttsProvider
 
 class TTSFactory:
     @staticmethod
     def create(event_bus: EventBus, config: TTSConfig):
+        # Providers are imported on demand, xtts pulls in torch and TTS
         if config.provider == "elevenlabs":
+            from .providers.elevenlabs_provider import ElevenLabsTTSProvider
             if config.elevenlabs.api_key is None:
-                api_key = os.environ.get("ELEVENLABS_API_KEY")
-            if api_key:
-                config.elevenlabs.api_key = api_key
+                config.elevenlabs.api_key = os.environ.get("ELEVENLABS_API_KEY")
 
             return ElevenLabsTTSProvider(event_bus, config.elevenlabs)
         elif config.provider == "xtts":
+            from .providers.xtts_provider import XttsProvider
             return XttsProvider(event_bus, config.xtts)
         raise ValueError(f"Unkown TTS provider: {config.provider}")
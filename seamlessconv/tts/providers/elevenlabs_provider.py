@@ -8,6 +8,8 @@ from ..base_tts import BaseTTS
 
 logger = logging.getLogger(__name__)
 
+PCM_SAMPLE_RATE = 22050
+
 class ElevenLabsTTSProvider(BaseTTS):
     def __init__(self, event_bus: EventBus, settings: ElevenlabsSettings):
         super().__init__(event_bus)
@@ -30,10 +32,13 @@ class ElevenLabsTTSProvider(BaseTTS):
             }
         }
         url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/with-timestamps"
+        # Raw PCM only needs a WAV header to play, MP3 would have to be
+        # decoded through ffmpeg before the first sample
         response = requests.post(
             url,
             json=data,
             headers=headers,
+            params={"output_format": f"pcm_{PCM_SAMPLE_RATE}"},
         )
 
         if response.status_code != 200:
@@ -43,7 +48,10 @@ class ElevenLabsTTSProvider(BaseTTS):
         json_string = response.content.decode("utf-8")
         response_dict = json.loads(json_string)
 
-        audio_bytes = base64.b64decode(response_dict["audio_base64"])
+        audio_bytes = self.encode_wav(
+            base64.b64decode(response_dict["audio_base64"]),
+            PCM_SAMPLE_RATE
+        )
 
         word_timestamps = self.process_word_timings(
             response_dict['alignment'].get('characters'),
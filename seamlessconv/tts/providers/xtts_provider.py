@@ -1,12 +1,11 @@
 from dataclasses import dataclass
+from fractions import Fraction
 import logging
-import io
 from pathlib import Path
 from typing import List, Tuple, Optional
-from scipy.signal import resample
+from scipy.signal import resample_poly
 import numpy as np
 import torch
-import scipy.io.wavfile as wav_io
 from TTS.api import TTS
 from seamlessconv.config.settings import XttsSettings
 from seamlessconv.event.eventbus import EventBus
@@ -14,6 +13,10 @@ from ..base_tts import BaseTTS
 
 logger = logging.getLogger(__name__)
 
+torch.set_float32_matmul_precision("high")
+
+MAX_INPUT_TOKENS = 1024
+
 @dataclass
 class WordTimestamp:
     word: str
@@ -26,6 +29,14 @@ class XttsProvider(BaseTTS):
         self.settings = settings
         self.tts = self._initialize_tts()
         self.manager = self.tts.synthesizer.tts_model
+        # Polyphase resampling factors from the model rate to the configured rate
+        self._resample_factors = Fraction(
+            self.settings.sample_rate,
+            self.tts.synthesizer.output_sample_rate
+        ).limit_denominator(1000).as_integer_ratio()
+        self._device = next(self.manager.parameters()).device
+        self._input_buffer = self._allocate_input_buffer(MAX_INPUT_TOKENS)
+        self._vocoder = self._compile_vocoder()
 
     def _initialize_tts(self) -> TTS:
         logger.debug("Xtts model loading")
@@ -40,6 +51,21 @@ class XttsProvider(BaseTTS):
             logger.error("Failed to initialize TTS model: %s", e)
             raise
 
+    def _compile_vocoder(self):
+        """Compile the vocoder inference, falling back to eager mode"""
+        vocoder_inference = self.tts.synthesizer.vocoder_model.inference
+        try:
+            # Mel lengths differ per utterance, so compile for dynamic shapes
+            # instead of recompiling for every new length
+            return torch.compile(vocoder_inference, dynamic=True)
+        except Exception as e:
+            logger.warning("Vocoder compilation unavailable, running eagerly: %s", e)
+            return vocoder_inference
+
+    def _allocate_input_buffer(self, size: int) -> torch.Tensor:
+        """Allocate the token id buffer, pinned so copies to the GPU can be asynchronous"""
+        return torch.empty((1, size), dtype=torch.long, pin_memory=self._device.type == 'cuda')
+
     def _generate_mel_and_attention(self, text: str) -> Tuple[torch.Tensor, np.ndarray]:
         """
         Generate mel spectrogram and attention weights for input text.
@@ -50,10 +76,14 @@ class XttsProvider(BaseTTS):
         Returns:
             Tuple of (mel_outputs, attention_weights)
         """
-        inputs = self.manager.tokenizer.text_to_ids(text)
-        inputs = torch.LongTensor(inputs).unsqueeze(0)
-
-        with torch.no_grad():
+        token_ids = self.manager.tokenizer.text_to_ids(text)
+        n_tokens = len(token_ids)
+        if n_tokens > self._input_buffer.shape[1]:
+            self._input_buffer = self._allocate_input_buffer(n_tokens)
+        self._input_buffer[0, :n_tokens] = torch.as_tensor(token_ids, dtype=torch.long)
+        inputs = self._input_buffer[:, :n_tokens].to(self._device, non_blocking=True)
+
+        with torch.inference_mode():
             outputs = self.manager.inference(inputs)
             mel_outputs = outputs["model_outputs"][0].transpose(0, 1)
             attention_weights = outputs["alignments"][0].cpu().numpy()
@@ -70,26 +100,33 @@ class XttsProvider(BaseTTS):
         Returns:
             Tuple of (audio_wave, duration)
         """
-        mel_tensor = torch.FloatTensor(mel_outputs).unsqueeze(0)
-        wav = self.tts.synthesizer.vocoder_model.inference(mel_tensor)
+        # The mel spectrogram is already a float tensor on the model's device
+        with torch.inference_mode():
+            try:
+                wav = self._vocoder(mel_outputs.unsqueeze(0))
+            except Exception as e:
+                # torch.compile only fails once it traces the first call
+                logger.warning("Compiled vocoder failed, running eagerly: %s", e)
+                self._vocoder = self.tts.synthesizer.vocoder_model.inference
+                wav = self._vocoder(mel_outputs.unsqueeze(0))
         wav = wav.squeeze().cpu().numpy()
 
+        if self.settings.sample_rate != self.tts.synthesizer.output_sample_rate:
+            wav = self._resample_wav(wav)
 
         # Scale to 16-bit integer range
         # This needs to be converted to whatever smaplerate the config tells it
-        wav = wav * 32767 # TEMPORARY SOLUTION
-
-        if self.settings.sample_rate != self.tts.synthesizer.output_sample_rate:
-            wav = self._resample_wav(wav, self.settings.sample_rate)
+        wav = wav.astype(np.float32, copy=False)
+        np.multiply(wav, 32767, out=wav) # TEMPORARY SOLUTION
 
         duration = len(wav) / self.settings.sample_rate
 
         return wav, duration
 
 
-    def _resample_wav(self, wav, target_sample_rate):
-        num_samples = int(len(wav)*target_sample_rate/self.tts.synthesizer.output_sample_rate)
-        wav_resampled = resample(wav, num_samples)
+    def _resample_wav(self, wav):
+        up, down = self._resample_factors
+        wav_resampled = resample_poly(wav, up, down)
 
         return wav_resampled
 
@@ -112,27 +149,35 @@ class XttsProvider(BaseTTS):
         Returns:
             List of WordTimestamp objects
         """
-        time_per_frame = audio_duration / n_mel_frames
-        current_pos = 0
-        timestamps = []
-
-        for word in words:
-            word_length = len(self.manager.tokenizer.text_to_ids(word))
-            word_end = current_pos + word_length
-
-            word_attention = attention_weights[current_pos:word_end]
-            summed_attention = word_attention.sum(axis=0)
-
-            # Dynamic thresholding
-            threshold = summed_attention.mean() + summed_attention.std()
-            significant_frames = np.where(summed_attention > threshold)[0]
-
-            if len(significant_frames) > 0:
-                start_time = significant_frames[0] * time_per_frame
-                end_time = significant_frames[-1] * time_per_frame
-                timestamps.append(WordTimestamp(word, start_time, end_time))
+        if not words:
+            return []
 
-            current_pos = word_end + 1
+        time_per_frame = audio_duration / n_mel_frames
+        n_tokens, n_frames = attention_weights.shape
+
+        # Token span of every word, words are separated by one token
+        word_lengths = np.array([len(self.manager.tokenizer.text_to_ids(word)) for word in words])
+        word_starts = np.concatenate(([0], np.cumsum(word_lengths + 1)[:-1]))
+        word_ends = np.minimum(word_starts + word_lengths, n_tokens)
+        word_starts = np.minimum(word_starts, word_ends)
+
+        # Sum the attention of each word's tokens from a running sum over all
+        # tokens, empty spans come out as zero rows
+        cumulative = np.zeros((n_tokens + 1, n_frames))
+        np.cumsum(attention_weights, axis=0, out=cumulative[1:])
+        summed_attention = cumulative[word_ends] - cumulative[word_starts]
+
+        # Dynamic thresholding
+        threshold = summed_attention.mean(axis=1, keepdims=True) + summed_attention.std(axis=1, keepdims=True)
+        significant = summed_attention > threshold
+        first_frames = significant.argmax(axis=1)
+        last_frames = n_frames - 1 - significant[:, ::-1].argmax(axis=1)
+
+        timestamps = [
+            WordTimestamp(word, first * time_per_frame, last * time_per_frame)
+            for word, found, first, last in zip(words, significant.any(axis=1), first_frames, last_frames)
+            if found
+        ]
 
         return self._post_process_timestamps(timestamps, audio_duration)
 
@@ -154,41 +199,40 @@ class XttsProvider(BaseTTS):
         if not timestamps:
             return []
 
-        processed = []
-        total_words = len(timestamps)
+        word_gap = self.settings.word_gap
+        min_word_duration = self.settings.min_word_duration
+        starts = []
+        ends = []
+        previous_end = None
 
-        for i, stamp in enumerate(timestamps):
+        # Spacing only needs the times, the WordTimestamp objects are built
+        # once with the scaled values
+        for stamp, next_stamp in zip(timestamps, timestamps[1:] + [None]):
             start = stamp.start
             end = stamp.end
 
-            if i > 0:
+            if previous_end is not None:
                 # Ensure start time is after previous end time
-                start = max(start, processed[-1].end + self.settings.word_gap)
+                start = max(start, previous_end + word_gap)
 
-            if i < total_words - 1:
+            if next_stamp is not None:
                 # Adjust end time to not overlap with next word
-                end = min(end, timestamps[i + 1].start - self.settings.word_gap)
+                end = min(end, next_stamp.start - word_gap)
 
             # Min duration
-            if end - start < self.settings.min_word_duration:
-                end = start + self.settings.min_word_duration
+            if end - start < min_word_duration:
+                end = start + min_word_duration
 
-            processed.append(WordTimestamp(stamp.word, start, end))
+            starts.append(start)
+            ends.append(end)
+            previous_end = end
 
         # Scale timestamps to match total audio duration
-        if processed:
-            final_end = processed[-1].end
-            scaling_factor = audio_duration / final_end
-            processed = [
-                WordTimestamp(
-                    stamp.word,
-                    stamp.start * scaling_factor,
-                    stamp.end * scaling_factor
-                )
-                for stamp in processed
-            ]
-
-        return processed
+        scaling_factor = audio_duration / ends[-1]
+        return [
+            WordTimestamp(stamp.word, start * scaling_factor, end * scaling_factor)
+            for stamp, start, end in zip(timestamps, starts, ends)
+        ]
 
     def synthesize_speech(
         self,
@@ -214,23 +258,12 @@ class XttsProvider(BaseTTS):
             # This needs to be converted to whatever smaplerate the config tells it
             wav_int16 = wav.astype(np.int16) #TEMPORARY SOLUTION
 
-            audio_stream = io.BytesIO()
-            wav_io.write(
-                audio_stream,
-                self.settings.sample_rate,
-                wav_int16
-            )
-            audio_stream.seek(0)
-            audio_bytes = audio_stream.getvalue()
+            audio_bytes = self.encode_wav(wav_int16.tobytes(), self.settings.sample_rate)
 
             if output_path:
                 output_path = Path(output_path)
                 output_path.parent.mkdir(parents=True, exist_ok=True)
-                wav_io.write(
-                    output_path,
-                    self.settings.sample_rate,
-                    wav_int16
-                )
+                output_path.write_bytes(audio_bytes)
                 logger.info("Audio saved to %s", output_path)
 
             timestamp_to_return = [(t.word, t.end) for t in timestamps]
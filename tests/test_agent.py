@@ -0,0 +1,122 @@
+import unittest
+from uuid import uuid4
+from seamlessconv.agents.agent import Agent
+from seamlessconv.agents.conversation_group import ConversationGroup
+from seamlessconv.agents.speaker_types import SpeakerState
+from seamlessconv.event.eventbus import Event, EventType
+
+class FakeStore:
+    """Stand-in for the SessionManager that returns a fixed history"""
+    def __init__(self, messages):
+        self.messages = messages
+        self.loads = 0
+        self.on_load = None
+
+    def get_agent_messages(self, agent_id, group_id, message_types=None):
+        self.loads += 1
+        if self.on_load:
+            self.on_load()
+        return [dict(msg) for msg in self.messages]
+
+class TestAgent(unittest.TestCase):
+    """Test suite for the Agent's cached conversation history."""
+    def setUp(self):
+        self.agent_id = uuid4()
+        self.other_id = uuid4()
+        self.group_id = uuid4()
+        self.store = FakeStore([
+            {'content': "User: Hello", 'type': 'response', 'source_agent_id': self.other_id},
+            {'content': "[RESPONSE]", 'type': 'decision', 'source_agent_id': self.agent_id}
+        ])
+        self.agent = Agent(self.agent_id, None, self.store)
+
+    def _message(self, agent_id, text, message_type):
+        return Event(
+            type=EventType.LLM_RESPONSE_READY,
+            agent_id=agent_id,
+            group_id=self.group_id,
+            timestamp=None,
+            data={'text': text, 'context': {'type': message_type}}
+        )
+
+    def test_history_is_loaded_when_joining_a_group(self):
+        """Test that joining a group loads the stored history once, outside the group lock."""
+        self.assertEqual(self.agent._get_history(["response"]), [])
+
+        group = ConversationGroup(self.group_id)
+        self.store.on_load = lambda: self.assertFalse(group._lock.locked())
+        group.add_member(self.agent)
+        self.assertEqual(self.store.loads, 1)
+        self.assertEqual(
+            self.agent._get_history(["decision", "response"]),
+            [
+                {"role": "user", "content": "User: Hello"},
+                {"role": "assistant", "content": "[RESPONSE]"}
+            ]
+        )
+        self.assertEqual(
+            self.agent._get_history(["response"]),
+            [{"role": "user", "content": "User: Hello"}]
+        )
+
+    def test_append_history_extends_matching_views(self):
+        """Test that appended messages reach every formatted view of their type."""
+        ConversationGroup(self.group_id).add_member(self.agent)
+        responses = self.agent._get_history(["response"])
+        everything = self.agent._get_history(["decision", "response"])
+
+        self.agent.append_history(self._message(self.agent_id, "Sam: Hi!", "response"))
+        self.agent.append_history(self._message(self.agent_id, "[SKIP]", "decision"))
+
+        self.assertEqual(
+            self.agent._get_history(["response"]),
+            [*responses, {"role": "assistant", "content": "Sam: Hi!"}]
+        )
+        self.assertEqual(
+            self.agent._get_history(["decision", "response"]),
+            [
+                *everything,
+                {"role": "assistant", "content": "Sam: Hi!"},
+                {"role": "assistant", "content": "[SKIP]"}
+            ]
+        )
+        self.assertEqual(self.store.loads, 1)
+
+    def test_returned_history_is_a_copy(self):
+        """Test that later messages do not change a history already handed out."""
+        ConversationGroup(self.group_id).add_member(self.agent)
+        history = self.agent._get_history(["response"])
+
+        self.agent.append_history(self._message(self.other_id, "User: Anyone there?", "response"))
+        self.assertEqual(len(history), 1)
+
+    def test_append_history_outside_a_group_is_ignored(self):
+        """Test that an agent without a group keeps no history."""
+        self.agent.append_history(self._message(self.other_id, "User: Hello", "response"))
+        self.assertEqual(self.agent._get_history(["response"]), [])
+        self.assertEqual(self.store.loads, 0)
+
+    def test_state_changes_are_reported_without_the_agent_lock(self):
+        """Test that the group is notified only after the agent lock is released."""
+        reported = []
+
+        def on_state_change(agent_id, state):
+            self.assertFalse(self.agent._lock.locked())
+            reported.append(state)
+
+        self.agent.set_group(self.group_id, on_state_change)
+        self.agent.set_speaking()
+        self.agent.handle_llm_error()
+        self.agent.reset_pending()
+        self.agent.state = SpeakerState.PENDING_DECISION
+        self.agent.handle_llm(self._message(self.agent_id, "[SKIP]", "decision"))
+
+        self.assertEqual(reported, [
+            SpeakerState.SPEAKING,
+            SpeakerState.WAITING,
+            SpeakerState.WAITING
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
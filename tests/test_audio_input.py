@@ -0,0 +1,61 @@
+import unittest
+from unittest import mock
+import numpy as np
+
+# sounddevice raises OSError on import when PortAudio is not installed
+try:
+    from seamlessconv.stt import audio_input
+except (ImportError, OSError):
+    audio_input = None
+
+@unittest.skipIf(audio_input is None, "sounddevice is not available")
+class TestAudioInput(unittest.TestCase):
+    """Test suite for the AudioInput ring buffer between the stream callback and the reader."""
+    def setUp(self):
+        patcher = mock.patch.object(audio_input.sd, "InputStream")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.audio_input = audio_input.AudioInput(audio_input.AudioConfig(blocksize=4))
+        self.audio_input.start()
+        self.addCleanup(self.audio_input.stop)
+
+    def _push(self, value):
+        self.audio_input._audio_callback(np.full((4, 1), value, dtype=np.int16), 4, {}, None)
+
+    def test_empty_ring_times_out(self):
+        """Test that reading an empty ring returns None once the timeout passes."""
+        self.assertIsNone(self.audio_input.get_audio_block(0.01))
+
+    def test_blocks_are_read_in_order_across_wraparound(self):
+        """Test that blocks come out in order after the ring has wrapped several times."""
+        for value in range(audio_input.AUDIO_SLOTS * 3):
+            self._push(value)
+            block = self.audio_input.get_audio_block(0)
+            self.assertEqual(block.shape, (4, 1))
+            self.assertTrue((block == value).all())
+
+    def test_full_ring_drops_new_blocks(self):
+        """Test that the callback drops blocks instead of overwriting unread ones."""
+        for value in range(audio_input.AUDIO_SLOTS + 4):
+            self._push(value)
+
+        blocks = self.audio_input.get_audio_blocks(0)
+        self.assertEqual(
+            blocks[::4, 0].tolist(), list(range(audio_input.AUDIO_SLOTS - 1))
+        )
+        self.assertIsNone(self.audio_input.get_audio_block(0))
+
+    def test_get_audio_blocks_joins_pending_blocks_after_wraparound(self):
+        """Test that pending blocks spanning the end of the ring are joined in order."""
+        for value in range(audio_input.AUDIO_SLOTS - 2):
+            self._push(value)
+            self.audio_input.get_audio_block(0)
+        for value in range(5):
+            self._push(100 + value)
+
+        blocks = self.audio_input.get_audio_blocks(0)
+        self.assertEqual(blocks[::4, 0].tolist(), [100, 101, 102, 103, 104])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from uuid import uuid4
+from seamlessconv.event.eventbus import Event, EventType
+from seamlessconv.llm.base_llm import BaseLLM
+
+class TestBaseLLM(unittest.TestCase):
+    """Test suite for the request handling shared by all LLM providers."""
+    def _request(self, request_type, content, system="system prompt"):
+        return Event(
+            type=EventType.LLM_INPUT_RECEIVED,
+            agent_id=uuid4(),
+            group_id=uuid4(),
+            timestamp=None,
+            data={
+                'system': ({"role": "system", "content": system},),
+                'messages': [{"role": "user", "content": content}],
+                'context': {'type': request_type}
+            }
+        )
+
+    def test_coalesce_groups_identical_decisions(self):
+        """Test that decision requests with the same prompt share a group, in order."""
+        first = self._request("decision", "Hello")
+        other = self._request("decision", "Bye")
+        second = self._request("decision", "Hello")
+
+        self.assertEqual(BaseLLM._coalesce([first, other, second]), [[first, second], [other]])
+
+    def test_coalesce_keeps_different_system_prompts_apart(self):
+        """Test that decisions for different personalities are not merged."""
+        first = self._request("decision", "Hello", system="calm")
+        second = self._request("decision", "Hello", system="grumpy")
+
+        self.assertEqual(BaseLLM._coalesce([first, second]), [[first], [second]])
+
+    def test_coalesce_never_merges_responses(self):
+        """Test that response requests each get their own call, even with the same prompt."""
+        first = self._request("response", "Hello")
+        second = self._request("response", "Hello")
+
+        self.assertEqual(BaseLLM._coalesce([first, second]), [[first], [second]])
+
+
+if __name__ == '__main__':
+    unittest.main()
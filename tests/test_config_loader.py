@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from seamlessconv.config import loader
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config.yaml")
+
+class TestLoadConfig(unittest.TestCase):
+    """Test suite for load_config and its in-process and on-disk caches."""
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.path = os.path.join(self.tmp_dir, "config.yaml")
+        shutil.copyfile(CONFIG_PATH, self.path)
+        loader._config_cache.clear()
+        self.addCleanup(loader._config_cache.clear)
+
+    def _sidecars(self):
+        return [name for name in os.listdir(self.tmp_dir) if name.endswith(".pkl")]
+
+    def test_unchanged_file_is_parsed_once(self):
+        """Test that loading an unchanged file again does not parse it again."""
+        config = loader.load_config(self.path)
+        with mock.patch.object(loader.yaml, "load") as yaml_load:
+            again = loader.load_config(self.path)
+        yaml_load.assert_not_called()
+        self.assertEqual(config, again)
+
+    def test_callers_get_independent_copies(self):
+        """Test that changing a returned config does not change the cached one."""
+        config = loader.load_config(self.path)
+        config.llm.openai.api_key = "secret"
+        self.assertIsNone(loader.load_config(self.path).llm.openai.api_key)
+
+    def test_sidecar_is_used_by_a_new_process(self):
+        """Test that a validated config is reused from its sidecar when the memory cache is empty."""
+        config = loader.load_config(self.path)
+        self.assertEqual(len(self._sidecars()), 1)
+
+        loader._config_cache.clear()
+        with mock.patch.object(loader.yaml, "load") as yaml_load:
+            self.assertEqual(loader.load_config(self.path), config)
+        yaml_load.assert_not_called()
+
+    def test_sidecar_from_another_schema_is_ignored(self):
+        """Test that a config pickled for a different AppConfig definition is parsed again."""
+        loader.load_config(self.path)
+        loader._config_cache.clear()
+
+        with mock.patch.object(loader, "_schema_fingerprint", return_value="0" * 16):
+            with mock.patch.object(loader.yaml, "load", wraps=loader.yaml.load) as yaml_load:
+                loader.load_config(self.path)
+        yaml_load.assert_called_once()
+        self.assertEqual(len(self._sidecars()), 1)
+
+    def test_changed_file_is_reloaded(self):
+        """Test that editing the file invalidates both caches and drops the stale sidecar."""
+        loader.load_config(self.path)
+        stat = os.stat(self.path)
+        with open(self.path, "r", encoding="utf-8") as f:
+            content = f.read()
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(content.replace("temperature: 0.7", "temperature: 0.2"))
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(loader.load_config(self.path).llm.openai.temperature, 0.2)
+        self.assertEqual(len(self._sidecars()), 1)
+
+    def test_failed_sidecar_write_leaves_no_files(self):
+        """Test that a sidecar that cannot be written neither fails loading nor leaves temp files."""
+        with mock.patch.object(loader.pickle, "dump", side_effect=TypeError("cannot pickle")):
+            loader.load_config(self.path)
+        self.assertEqual(os.listdir(self.tmp_dir), ["config.yaml"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from uuid import uuid4
+from seamlessconv.agents.decision_cache import DecisionCache
+
+class TestDecisionCache(unittest.TestCase):
+    """Test suite for the DecisionCache class, which reuses LLM decisions on the same context."""
+    def setUp(self):
+        self.cache = DecisionCache(window=2, max_entries=2)
+        self.agent_id = uuid4()
+        self.messages = [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi"},
+            {"role": "user", "content": "How are you?"}
+        ]
+
+    def test_put_and_get(self):
+        """Test that a stored decision is returned for the same key."""
+        key = self.cache.make_key(self.agent_id, "prompt", self.messages, False)
+        self.assertIsNone(self.cache.get(key))
+        self.cache.put(key, "[SKIP]")
+        self.assertEqual(self.cache.get(key), "[SKIP]")
+
+    def test_key_only_uses_recent_messages(self):
+        """Test that messages outside the window do not change the key."""
+        key = self.cache.make_key(self.agent_id, "prompt", self.messages, False)
+        older = [{"role": "user", "content": "Earlier"}, *self.messages[1:]]
+        self.assertEqual(key, self.cache.make_key(self.agent_id, "prompt", older, False))
+
+    def test_key_includes_agent_prompt_and_interruption(self):
+        """Test that decisions are not shared between agents, prompts or interruption states."""
+        key = self.cache.make_key(self.agent_id, "prompt", self.messages, False)
+        self.assertNotEqual(key, self.cache.make_key(uuid4(), "prompt", self.messages, False))
+        self.assertNotEqual(key, self.cache.make_key(self.agent_id, "other", self.messages, False))
+        self.assertNotEqual(key, self.cache.make_key(self.agent_id, "prompt", self.messages, True))
+
+    def test_only_control_tokens_are_cached(self):
+        """Test that free text answers are not cached."""
+        key = self.cache.make_key(self.agent_id, "prompt", self.messages, False)
+        self.cache.put(key, "Sure, I can answer that.")
+        self.assertIsNone(self.cache.get(key))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache keeps at most max_entries, dropping the least recently used."""
+        keys = [
+            self.cache.make_key(self.agent_id, f"prompt {i}", self.messages, False)
+            for i in range(3)
+        ]
+        self.cache.put(keys[0], "[SKIP]")
+        self.cache.put(keys[1], "[SKIP]")
+        self.cache.get(keys[0])
+        self.cache.put(keys[2], "[SKIP]")
+
+        self.assertEqual(self.cache.get(keys[0]), "[SKIP]")
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertEqual(self.cache.get(keys[2]), "[SKIP]")
+
+
+if __name__ == '__main__':
+    unittest.main()
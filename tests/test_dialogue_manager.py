@@ -0,0 +1,108 @@
+import time
+import unittest
+from uuid import uuid4
+from seamlessconv.agents.agent import Agent
+from seamlessconv.dialogue.dialogue_manager import DialogueManager
+from seamlessconv.event.eventbus import Event, EventType
+
+class FakeEventBus:
+    """Event bus that drops everything, handlers are called directly"""
+    def subscribe(self, event_type, callback):
+        pass
+
+    def publish(self, event):
+        pass
+
+class FakeStore:
+    """In-memory stand-in for the SessionManager message methods"""
+    def __init__(self):
+        self.messages = []
+
+    def enqueue_message(self, event, agents):
+        self.messages.append({
+            'group_id': event.group_id,
+            'witnesses': {member for member, _ in agents},
+            'content': event.data['text'],
+            'type': event.data['context']['type'],
+            'source_agent_id': event.agent_id
+        })
+
+    def get_agent_messages(self, agent_id, group_id, message_types=None):
+        return [
+            {key: msg[key] for key in ('content', 'type', 'source_agent_id')}
+            for msg in self.messages
+            if msg['group_id'] == group_id and agent_id in msg['witnesses']
+            and (message_types is None or msg['type'] in message_types)
+        ]
+
+class TestDialogueManager(unittest.TestCase):
+    """
+    Test suite for the DialogueManager class, checking what ends up in the
+    stored messages and the agents' cached histories.
+    """
+    def setUp(self):
+        self.store = FakeStore()
+        self.event_bus = FakeEventBus()
+        self.dialogue_manager = DialogueManager(self.event_bus, self.store)
+        self.group_id = uuid4()
+        self.group = self.dialogue_manager.create_group(self.group_id)
+        self.speaker = Agent(uuid4(), self.event_bus, self.store)
+        self.listener = Agent(uuid4(), self.event_bus, self.store)
+        self.group.add_member(self.speaker)
+        self.group.add_member(self.listener)
+
+    def _speech_event(self, event_type, text, speech_finished):
+        return Event(
+            type=event_type,
+            agent_id=self.speaker.agent_id,
+            group_id=self.group_id,
+            timestamp=time.time(),
+            data={
+                'text': text,
+                'context': {'type': 'response', 'speech_finished': speech_finished}
+            }
+        )
+
+    def test_streamed_speech_warm_history_matches_stored(self):
+        """Test that a streamed utterance is cached once, the same as it is stored."""
+        for snippet in ("Hello there.", "How are you?"):
+            self.dialogue_manager._handle_speech_streaming(
+                self._speech_event(EventType.TTS_STREAMING_RESPONSE, snippet, False)
+            )
+        self.dialogue_manager._handle_speech_ended(
+            self._speech_event(EventType.SPEECH_ENDED, "Fine.", True)
+        )
+
+        self.assertEqual(len(self.store.messages), 1)
+        self.assertEqual(
+            self.store.messages[0]['content'], "Hello there. How are you? Fine. [EOI]"
+        )
+
+        # An agent joining now loads the same history from the store
+        cold_listener = Agent(self.listener.agent_id, self.event_bus, self.store)
+        cold_listener.set_group(
+            self.group_id, history=cold_listener.load_history(self.group_id)
+        )
+        self.assertEqual(
+            self.listener._get_history(["decision", "response"]),
+            cold_listener._get_history(["decision", "response"])
+        )
+
+    def test_streamed_snippet_is_not_cached_until_stored(self):
+        """Test that a held back snippet only reaches the history with the final part."""
+        self.dialogue_manager._handle_speech_streaming(
+            self._speech_event(EventType.TTS_STREAMING_RESPONSE, "Hello there.", False)
+        )
+        self.assertEqual(self.listener._get_history(["response"]), [])
+
+        self.dialogue_manager._handle_speech_ended(
+            self._speech_event(EventType.SPEECH_ENDED, "Fine.", True)
+        )
+        self.assertEqual(
+            self.listener._get_history(["response"]),
+            [{"role": "user", "content": "Hello there. Fine. [EOI]"}]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
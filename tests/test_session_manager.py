@@ -83,6 +83,33 @@ class TestSessionManager(unittest.TestCase):
         self.assertEqual(messages[0]['content'], 'Hello, this is a test message.')
         self.assertEqual(messages[0]['type'], 'test')
 
+    def test_enqueue_message_and_get_messages(self):
+        """Test that queued messages are returned in order once the writer stores them."""
+        agents = [(self.agent_id, "see_hear")]
+        event_id = self.session_manager.create_and_store_event(
+            self.agent_id, agents, "test_message_event"
+        )
+        self.event_ids.append(event_id)
+        group_id = self.session_manager.create_conversation_group(event_id)
+        self.group_ids.append(group_id)
+
+        texts = ['First queued message.', 'Second queued message.']
+        for text in texts:
+            self.session_manager.enqueue_message(
+                Event(
+                    type=EventType.LLM_RESPONSE_READY,
+                    agent_id=self.agent_id,
+                    group_id=group_id,
+                    data={'text': text, 'context': {'type': 'test'}},
+                    timestamp=None
+                ),
+                agents
+            )
+
+        messages = self.session_manager.get_agent_messages(self.agent_id, group_id)
+        self.assertEqual([message['content'] for message in messages], texts)
+        self.assertEqual([message['type'] for message in messages], ['test', 'test'])
+        self.assertLess(messages[0]['sequence'], messages[1]['sequence'])
 
     def test_create_agent_uniqueness_violation(self):
         """
@@ -119,6 +146,7 @@ class TestSessionManager(unittest.TestCase):
             self.session_manager.store.delete_save(save_id)
         for app_id in self.app_ids:
             self.session_manager.store.delete_application(app_id)
+        self.session_manager.close()
 
 
 if __name__ == '__main__':